@@ -1,36 +1,127 @@
 """
 Chrome WebDriver configuration for Court Scheduler.
 """
+import ctypes
 import os
-import subprocess
+import shutil
+import sys
+from functools import lru_cache
+from typing import Optional
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 
 from .config import Config
 
+_APPLICATION_SERVICES = "/System/Library/Frameworks/ApplicationServices.framework/ApplicationServices"
+_CORE_FOUNDATION = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+
+# Headless 감지 방지용 User-Agent
+_UA = (
+    "Mozilla/5.0 (X11; Linux x86_64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/142.0.0.0 Safari/537.36"
+)
+
+# GUI 모드 Chrome 인자
+_GUI_ARGS = (
+    "--window-size=1920,1080",
+)
+
+# Headless 모드 Chrome 인자 (GitHub Actions 또는 디스플레이 없음)
+_HEADLESS_ARGS = (
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    # User-Agent 설정 (headless 감지 방지)
+    f"--user-agent={_UA}",
+    # 예약과 무관한 백그라운드 서비스 비활성화 (기동 시간/CPU 절감)
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--disable-client-side-phishing-detection",
+    "--disable-component-update",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+    "--mute-audio",
+)
+
+# 자동화 감지 우회 인자/실험 옵션 (config.stealth일 때만 적용)
+_STEALTH_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+)
+_STEALTH_EXPERIMENTAL = (
+    ("excludeSwitches", ("enable-automation",)),
+    ("useAutomationExtension", False),
+)
+
+# Headless 모드에서 차단할 정적 리소스 (DOM만 필요하므로 바이트 낭비)
+# 캡차는 captcha.do에서 내려오므로 이미지 확장자 차단에 걸리지 않음
+# 코트 상태는 <img>의 src 속성으로만 판별하므로 이미지가 로드되지 않아도 무관
+_BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+)
+
 
+@lru_cache(maxsize=1)
 def is_display_available() -> bool:
-    """Check if display is available (macOS/Linux)."""
+    """
+    Check if display is available (macOS/Linux).
+    
+    디스플레이 상태는 프로세스 수명 동안 변하지 않으므로 결과를 캐시합니다.
+    """
     # GitHub Actions에서는 항상 headless
     if os.getenv("GITHUB_ACTIONS"):
         return False
     
-    try:
-        # macOS: Check WindowServer process
-        result = subprocess.run(
-            ['pgrep', '-f', 'WindowServer'],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+    if sys.platform == "darwin":
+        # macOS: GUI 로그인 세션이 있으면 CoreGraphics 세션 딕셔너리가 반환됨
+        try:
+            cg = ctypes.CDLL(_APPLICATION_SERVICES)
+            cg.CGSessionCopyCurrentDictionary.restype = ctypes.c_void_p
+            session = cg.CGSessionCopyCurrentDictionary()
+            if not session:
+                return False
+            cf = ctypes.CDLL(_CORE_FOUNDATION)
+            cf.CFRelease.argtypes = [ctypes.c_void_p]
+            cf.CFRelease(session)
+            return True
+        except Exception:
+            return False
+    
+    # Linux: X11/Wayland 디스플레이 환경변수 확인
+    return bool(os.getenv("DISPLAY") or os.getenv("WAYLAND_DISPLAY"))
+
+
+# 디스플레이 상태는 프로세스 수명 동안 고정이므로 import 시점에 모드/인자 결정
+_DISPLAY_AVAILABLE = is_display_available()
+_CHOSEN_ARGS = _GUI_ARGS if _DISPLAY_AVAILABLE else _HEADLESS_ARGS
+
+
+@lru_cache(maxsize=1)
+def find_chromedriver() -> Optional[str]:
+    """
+    chromedriver 경로를 한 번만 찾아 캐시합니다.
+    
+    경로를 찾지 못하면 None을 반환하고, 이 경우 Selenium Manager가 해석합니다.
+    """
+    return os.getenv("CHROMEDRIVER_PATH") or shutil.which("chromedriver")
 
 
 def create_driver(config: Config) -> webdriver.Chrome:
     """
     Create and configure Chrome WebDriver.
     
+    Chrome 기동 비용이 크므로 실행당 한 번만 생성하고, 모든 전략/재시도에서
+    같은 인스턴스를 재사용한 뒤 종료 시점에만 quit() 합니다.
+    
     Args:
         config: Application configuration
         
@@ -39,38 +130,52 @@ def create_driver(config: Config) -> webdriver.Chrome:
     """
     options = Options()
     
-    # 🚀 페이지 로드 전략: eager = DOM만 로드되면 진행 (이미지/CSS 기다리지 않음)
-    options.page_load_strategy = 'eager'
+    # 🚀 페이지 로드 전략: none = DOMContentLoaded도 기다리지 않음
+    # (driver.get/refresh 이후 필요한 요소는 호출부에서 WebDriverWait로 명시적 대기)
+    options.page_load_strategy = config.page_load_strategy
     
-    # 디스플레이 상태에 따라 headless 모드 결정
+    # 디스플레이 상태에 따라 headless 모드 결정 (import 시점에 계산된 값 사용)
     # 로컬 환경(디스플레이 있음)에서는 GUI 모드로 실행
-    if is_display_available():
-        # GUI 모드
-        print("[Browser] 🖥️ GUI 모드로 실행 (디스플레이 감지됨)")
-        options.add_argument("--window-size=1920,1080")
-    else:
+    headless = not _DISPLAY_AVAILABLE
+    if headless:
         # Headless 모드 (GitHub Actions 또는 디스플레이 없음)
         print("[Browser] 🔧 Headless 모드로 실행")
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-        # User-Agent 설정 (headless 감지 방지)
-        options.add_argument(
-            "--user-agent=Mozilla/5.0 (X11; Linux x86_64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/142.0.0.0 Safari/537.36"
-        )
+    else:
+        print("[Browser] 🖥️ GUI 모드로 실행 (디스플레이 감지됨)")
+    for arg in _CHOSEN_ARGS:
+        options.add_argument(arg)
+    if headless and config.stealth:
+        for arg in _STEALTH_ARGS:
+            options.add_argument(arg)
+        for name, value in _STEALTH_EXPERIMENTAL:
+            options.add_experimental_option(
+                name, list(value) if isinstance(value, tuple) else value
+            )
     
     # WebDriver 생성
-    driver = webdriver.Chrome(options=options)
+    # Service는 프로세스 수명을 관리하므로 매번 생성하되, 경로 탐색은 캐시 사용
+    chromedriver_path = find_chromedriver()
+    if chromedriver_path:
+        service = Service(executable_path=chromedriver_path)
+        driver = webdriver.Chrome(service=service, options=options)
+    else:
+        driver = webdriver.Chrome(options=options)
     
     # 타임아웃 설정
-    driver.implicitly_wait(config.implicit_wait)
+    # implicit wait는 끄고 필요한 곳에서만 WebDriverWait(driver, config.implicit_wait) 사용
+    # (implicit/explicit 혼용 시 find_element 실패마다 숨은 대기가 발생)
+    driver.implicitly_wait(0)
     driver.set_page_load_timeout(config.page_load_timeout)
     
+    # 정적 리소스 차단 (Chrome 전역 prefs로 이미지를 끄면 캡차 스크린샷이 깨지므로
+    # CDP URL 패턴 차단을 사용)
+    if headless and config.block_static_assets:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)}
+            )
+        except Exception as e:
+            print(f"[Browser] ⚠️ 정적 리소스 차단 설정 실패: {e}")
+    
     return driver
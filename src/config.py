@@ -3,32 +3,38 @@ Configuration management for Court Scheduler.
 """
 import os
 from dataclasses import dataclass, field
-from typing import List
+from typing import Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
 
-# Load environment variables from .env file (for local development)
-load_dotenv()
-
 
 # 코트 분류
-INDOOR_COURTS = [5, 6, 7, 8]  # 실내 코트 (21시까지만 운영)
-OUTDOOR_COURTS = [15, 14, 19, 18, 2, 13, 17, 16, 12, 11, 10, 9, 4, 3]  # 야외 코트
+# 코트 번호는 모두 256 미만이므로 bytes로 저장 (순회 시 int 반환, 불변/연속 버퍼)
+INDOOR_COURTS = bytes((5, 6, 7, 8))  # 실내 코트 (21시까지만 운영)
+OUTDOOR_COURTS = bytes((15, 14, 19, 18, 2, 13, 17, 16, 12, 11, 10, 9, 4, 3))  # 야외 코트
 ALL_COURTS = INDOOR_COURTS + OUTDOOR_COURTS  # 모든 코트
 
+# 멤버십 확인용 (순회는 위 bytes, `in` 검사는 아래 frozenset 사용)
+INDOOR_COURTS_SET = frozenset(INDOOR_COURTS)
+OUTDOOR_COURTS_SET = frozenset(OUTDOOR_COURTS)
+ALL_COURTS_SET = frozenset(ALL_COURTS)
+
+# 코트 번호 → 예약 페이지 코트 이미지 앵커 id (코트 번호는 1~19)
+COURT_IDS = {n: f'tennis_court_img_a_1_{n}' for n in range(1, 20)}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ReservationStrategy:
-    """예약 전략 정의"""
+    """예약 전략 정의 (불변 - 변경 시 dataclasses.replace 사용)"""
     name: str
     target_hour: int  # 시작 시간 (예: 19 = 19시), -1이면 자동 탐색 (가장 늦은 시간)
     time_slot_count: int  # 선택할 시간 슬롯 개수
-    preferred_courts: List[int]  # 시도할 코트 목록
+    preferred_courts: Sequence[int]  # 시도할 코트 목록 (bytes 권장)
     auto_find_latest: bool = False  # True면 가능한 가장 늦은 연속 시간대 자동 탐색
 
 
-# 예약 전략 목록 (우선순위 순)
-RESERVATION_STRATEGIES = [
+# 예약 전략 목록 (우선순위 순, 모든 Config 인스턴스가 공유하는 불변 튜플)
+RESERVATION_STRATEGIES = (
     # 1순위: 야외 코트 + 20시-22시
     ReservationStrategy(
         name="야외 코트 20-22시",
@@ -51,15 +57,15 @@ RESERVATION_STRATEGIES = [
         preferred_courts=ALL_COURTS,
         auto_find_latest=True,
     ),
-]
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReservationConfig:
     """Reservation preferences configuration."""
     
     # 예약 전략 목록
-    strategies: List[ReservationStrategy] = field(
+    strategies: Tuple[ReservationStrategy, ...] = field(
         default_factory=lambda: RESERVATION_STRATEGIES
     )
     
@@ -68,7 +74,16 @@ class ReservationConfig:
     reservation_open_minute: int = 0
 
 
-@dataclass
+# 필수 환경변수 (Config 속성명, 환경변수명)
+_REQUIRED_ENV = (
+    ("login_id", "LOGIN_ID"),
+    ("login_password", "LOGIN_PASSWORD"),
+    ("login_url", "LOGIN_URL"),
+    ("base_url", "BASE_URL"),
+)
+
+
+@dataclass(slots=True)
 class Config:
     """Main configuration class."""
     
@@ -86,36 +101,48 @@ class Config:
     
     # 브라우저 설정
     headless: bool = True
-    implicit_wait: int = 10
+    implicit_wait: int = 10  # 명시적 WebDriverWait 기본 타임아웃 (driver implicit wait는 0)
     page_load_timeout: int = 60
+    # none = 네비게이션 즉시 반환, 필요한 요소는 호출부에서 WebDriverWait로 대기
+    page_load_strategy: str = "none"
+    # headless 모드에서 자동화 감지 우회 옵션 적용 여부
+    stealth: bool = False
+    # headless 모드에서 이미지/폰트 다운로드 차단
+    block_static_assets: bool = True
     
     def __post_init__(self):
         """Load credentials from environment variables."""
-        self.login_id = os.getenv("LOGIN_ID", "")
-        self.login_password = os.getenv("LOGIN_PASSWORD", "")
-        self.login_url = os.getenv("LOGIN_URL", "")
-        self.base_url = os.getenv("BASE_URL", "")
-        self.slack_url = os.getenv("SLACK_URL", "")
+        env = os.environ
+        self.login_id = env.get("LOGIN_ID", "")
+        self.login_password = env.get("LOGIN_PASSWORD", "")
+        self.login_url = env.get("LOGIN_URL", "")
+        self.base_url = env.get("BASE_URL", "")
+        self.slack_url = env.get("SLACK_URL", "")
         
         # GitHub Actions에서는 headless 강제
-        if os.getenv("GITHUB_ACTIONS"):
+        if env.get("GITHUB_ACTIONS"):
             self.headless = True
     
     def validate(self) -> bool:
         """Validate required configuration."""
-        if not self.login_id:
-            raise ValueError("LOGIN_ID environment variable is required")
-        if not self.login_password:
-            raise ValueError("LOGIN_PASSWORD environment variable is required")
-        if not self.login_url:
-            raise ValueError("LOGIN_URL environment variable is required")
-        if not self.base_url:
-            raise ValueError("BASE_URL environment variable is required")
+        for attr, env_name in _REQUIRED_ENV:
+            if not getattr(self, attr):
+                raise ValueError(f"{env_name} environment variable is required")
         return True
 
 
+_CONFIG_SINGLETON: Optional[Config] = None
+
+
 def get_config() -> Config:
-    """Get configuration instance."""
-    config = Config()
-    config.validate()
-    return config
+    """Get configuration instance (검증된 인스턴스를 한 번만 생성해 재사용)."""
+    global _CONFIG_SINGLETON
+    if _CONFIG_SINGLETON is None:
+        # Load environment variables from .env file (for local development)
+        # GitHub Actions에는 .env가 없으므로 파일 탐색 생략
+        if not os.getenv("GITHUB_ACTIONS"):
+            load_dotenv()
+        config = Config()
+        config.validate()
+        _CONFIG_SINGLETON = config
+    return _CONFIG_SINGLETON
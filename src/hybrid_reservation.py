@@ -6,25 +6,262 @@ API Flow:
 1. Selenium: Login → WebGate → Extract cookies
 2. Requests: Calendar API → Time API → Captcha API → Basket API
 """
+import base64
 import io
 import re
 import time
-import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from email.utils import parsedate_to_datetime
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Deque, Iterator, List, Optional, Dict, Any, Tuple
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar, create_cookie
+from urllib3.util.retry import Retry
 from PIL import Image
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoAlertPresentException, StaleElementReferenceException
+from selenium.common.exceptions import NoAlertPresentException, TimeoutException, UnexpectedAlertPresentException
 
-from .config import Config, INDOOR_COURTS
+from .config import Config, COURT_IDS, INDOOR_COURTS_SET, ReservationStrategy
 from .notifier import Logger, SlackNotifier, ReservationResult
-from .reservation import CaptchaSolver, KST
+from .reservation import (
+    CaptchaSolver,
+    KST,
+    _JS_AVAILABLE_COURTS,
+    _JS_IMG_LOADED,
+    _JS_IMG_TO_DATA_URL,
+    _JS_TOGGLE_TIME_INDICES,
+    _SEL_CAPTCHA_IMG,
+    _SEL_LOGIN_BUTTON,
+    _SEL_LOGIN_ID,
+    _SEL_LOGIN_PWD,
+    _SEL_TIME_SLOTS,
+)
+
+
+# 캡차 wrap 표시 여부 (없으면 null)
+_JS_CAPTCHA_WRAP_VISIBLE = """
+const el = document.getElementById('layer_captcha_wrap');
+if (!el) return null;
+return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+"""
+
+# 예약 페이지(tab_by_date) 진입 또는 WebGate 대기열 화면 여부
+_JS_QUEUE_OR_READY = """
+if (window.__preRefresh) return false;
+if (document.getElementById('tab_by_date')) return true;
+const text = document.body ? document.body.innerText : '';
+return /대기|팀|webgate/i.test(text);
+"""
+
+
+# tab_by_date가 나타나면 즉시 true, arguments[0] ms 동안 안 나타나면 false (execute_async_script용, 새로고침 전 문서면 즉시 false)
+_JS_WAIT_FOR_TAB_BY_DATE = """
+const timeoutMs = arguments[0];
+const done = arguments[arguments.length - 1];
+if (window.__preRefresh) { done(false); return; }
+if (document.getElementById('tab_by_date')) { done(true); return; }
+const observer = new MutationObserver(() => {
+    if (document.getElementById('tab_by_date')) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+observer.observe(document.documentElement || document, {childList: true, subtree: true});
+const timer = setTimeout(() => { observer.disconnect(); done(false); }, timeoutMs);
+"""
+
+
+# 체크된 시간 슬롯 인덱스 목록 (ul#time_con li 순서 기준, 체크박스 없는 li도 인덱스 유지)
+_JS_CHECKED_TIME_INDICES = """
+const out = [];
+document.querySelectorAll('ul#time_con li').forEach((li, i) => {
+    const box = li.querySelector('input[type="checkbox"]');
+    if (box && box.checked) out.push(i);
+});
+return out;
+"""
+
+
+# 시간 슬롯을 target 인덱스(arguments[0]) 상태로 맞춤: 해제 → 선택 순서로 변경분만 클릭
+# 반환: {slotCount, inRange, changed, alerts, courtSignature(클릭 전 코트 이미지 상태)}
+_JS_SELECT_TIME_SLOTS = """
+const target = new Set(arguments[0]);
+const items = document.querySelectorAll('ul#time_con li');
+const boxes = Array.from(items, li => li.querySelector('input[type="checkbox"]'));
+const result = {slotCount: items.length, inRange: true, changed: false, alerts: [], courtSignature: ''};
+if (!items.length) return result;
+for (const i of target) {
+    if (i >= items.length) { result.inRange = false; return result; }
+}
+const deselect = [], select = [];
+boxes.forEach((box, i) => {
+    if (!box) return;
+    if (box.checked && !target.has(i)) deselect.push(i);
+    if (!box.checked && target.has(i)) select.push(i);
+});
+if (!deselect.length && !select.length) return result;
+result.changed = true;
+result.courtSignature = Array.from(
+    document.querySelectorAll("[id^='tennis_court_img_a_1_'] img"),
+    img => img.getAttribute('src')
+).join('|');
+const originalAlert = window.alert;
+window.alert = msg => { result.alerts.push(String(msg)); };
+try {
+    for (const i of deselect.concat(select)) boxes[i].click();
+} finally {
+    window.alert = originalAlert;
+}
+return result;
+"""
+
+# 코트 이미지 src 묶음 (시간 변경 후 코트 상태 갱신 감지용)
+_JS_COURT_IMG_SIGNATURE = """
+return Array.from(
+    document.querySelectorAll("[id^='tennis_court_img_a_1_'] img"),
+    img => img.getAttribute('src')
+).join('|');
+"""
+
+# 캡차 레이어의 <img>가 화면에 표시되고 로드 완료됐는지 여부
+_JS_CAPTCHA_IMG_READY = """
+const img = document.querySelector('#layer_captcha_wrap > div > img');
+return !!(img && img.offsetWidth > 0 && img.complete && img.naturalWidth > 0);
+"""
+
+# 캡차 <img>가 표시·로드됐으면 PNG data URL 반환 (canvas 실패 시 ''), 아직이면 null
+# arguments[0]: 클릭 전 캡차 로드 횟수 - 주어지면 그 뒤에 새로 로드된 이미지만 인정
+# (이전 캡차 레이어 재사용 방지, captcha.do가 고정 URL이어도 load 이벤트로 판별)
+_JS_CAPTCHA_SNAPSHOT = """
+const img = document.querySelector('#layer_captcha_wrap > div > img');
+if (!(img && img.offsetWidth > 0 && img.complete && img.naturalWidth > 0)) return null;
+const prevLoads = arguments[0];
+if (prevLoads != null && window.__captchaLoads !== undefined && window.__captchaLoads <= prevLoads) return null;
+try {
+    const canvas = document.createElement('canvas');
+    canvas.width = img.naturalWidth;
+    canvas.height = img.naturalHeight;
+    canvas.getContext('2d').drawImage(img, 0, 0);
+    return canvas.toDataURL('image/png');
+} catch (e) {
+    return '';
+}
+"""
+
+# 후킹된 alert 메시지가 있으면 {alert}, 없으면 캡차 스냅샷 결과(data URL / '' / null)
+_JS_ALERT_OR_CAPTCHA = """
+const msg = window.__lastAlert;
+if (msg) { window.__lastAlert = null; return {alert: msg}; }
+""" + _JS_CAPTCHA_SNAPSHOT
+
+# 캡차 새로고침 버튼 클릭 후 클릭 전 <img> src 반환 (버튼이 없으면 false)
+_JS_CLICK_CAPTCHA_REFRESH = """
+const btn = document.querySelector('#layer_captcha_wrap input[value="새로고침"]');
+if (!btn) return false;
+const img = document.querySelector('#layer_captcha_wrap > div > img');
+const src = img ? img.getAttribute('src') : null;
+btn.click();
+return src;
+"""
+
+# 코트 클릭 직전: 이전에 기록된 alert를 비우고 현재까지의 캡차 로드 횟수 반환 (헬퍼 없으면 null)
+_JS_BEFORE_COURT_CLICK = """
+window.__lastAlert = null;
+return window.__captchaLoads === undefined ? null : window.__captchaLoads;
+"""
+
+# 캡차 <img> src (새로고침으로 새 이미지가 들어왔는지 비교용)
+_JS_CAPTCHA_IMG_SRC = """
+const img = document.querySelector('#layer_captcha_wrap > div > img');
+return img ? img.getAttribute('src') : null;
+"""
+
+
+# 예약 가능한 날짜 링크의 href(javascript:fn_tennis_time_list(...)) 목록
+_JS_DATE_LINK_HREFS = """
+return Array.from(
+    document.querySelectorAll("tbody a[href^='javascript:fn_tennis_time_list']"),
+    a => a.getAttribute('href')
+);
+"""
+
+
+# 예약 페이지에 상주시키는 헬퍼 (9시 이후 호출은 미리 컴파일된 함수 호출만 수행)
+# 현재 문서에 바로 실행하고, 새 문서마다 다시 실행되도록 CDP에도 등록
+_JS_INSTALL_BOT_HELPERS = """
+window.__bot = window.__bot || {
+    click: el => el.click(),
+    ready: () => document.readyState,
+};
+// 페이지 alert 메시지를 기록한 뒤 원래 alert를 그대로 호출 (대화상자는 평소처럼 표시)
+// → 코트 클릭 결과는 switch_to.alert 왕복 없이 스크립트로 확인
+if (!window.__botAlertHooked) {
+    window.__botAlertHooked = true;
+    window.__lastAlert = null;
+    const originalAlert = window.alert;
+    window.alert = function (msg) {
+        window.__lastAlert = String(msg);
+        return originalAlert.apply(this, arguments);
+    };
+}
+// 캡차 <img> load 이벤트 횟수 (load는 버블링되지 않으므로 capture 단계에서 집계)
+// → 같은 URL로 다시 로드돼도 새 이미지 도착을 판별
+if (window.__captchaLoads === undefined) {
+    window.__captchaLoads = 0;
+    document.addEventListener('load', e => {
+        const t = e.target;
+        if (t && t.tagName === 'IMG' && t.closest('#layer_captcha_wrap')) window.__captchaLoads++;
+    }, true);
+}
+"""
+
+# 헬퍼가 없으면(페이지 이동 등) 직접 수행하는 fallback 포함
+_JS_CLICK = "(window.__bot ? window.__bot.click : el => el.click())(arguments[0]);"
+_JS_READY_STATE = "return window.__bot ? window.__bot.ready() : document.readyState;"
+
+
+# 장바구니 응답 중 "다른 사용자가 예약 진행중" 코드 (잠시 후 재요청하면 풀릴 수 있음)
+_BASKET_CONTENTION_CODES = frozenset({5, 9})
+
+# 경합 재요청 중 캡차 오류가 나면 첫 요청에서 캡차가 소모된 것 (같은 답으로는 재시도 불가)
+_CAPTCHA_CONSUMED_MSG = "캡차 소모됨 (경합 재요청 중 captcha 오류)"
+
+
+def _is_captcha_error(text: str) -> bool:
+    """장바구니 응답/메시지가 캡차(자동입력 방지) 오류인지 여부."""
+    return "captcha" in text.lower() or "자동입력" in text
+
+# 장바구니 POST 공통 헤더 (호출마다 새 dict를 만들지 않도록 모듈 상수로 고정)
+_JSON_HEADERS = {'Content-Type': 'application/json; charset=utf-8'}
+
+
+def _mount_pooled_adapter(session: requests.Session, pool_connections: int, pool_maxsize: int) -> None:
+    """keep-alive 커넥션 풀과 짧은 재시도를 가진 HTTPAdapter를 세션에 장착합니다."""
+    # 읽기 오류/5xx 재시도는 멱등 요청(GET/HEAD)만: 장바구니 POST를 urllib3가 재전송하면 중복 신청 위험
+    # (POST는 요청이 나가기 전인 연결 실패만 재시도, 경합 코드 재시도는 api_add_to_basket 루프가 담당)
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET", "HEAD"],
+        ),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Connection'] = 'keep-alive'
 
 
 class HybridReservationBot:
@@ -42,6 +279,9 @@ class HybridReservationBot:
     API_BASKET_INSERT = "./tennis_basket_ins.do"
     API_BASKET_LIST = "./tennis_mbasket_list.do"
     
+    # 서버 시간 측정 간격 (5회 × 0.2초 ≈ 1초: Date 헤더의 1초 경계 내 서로 다른 위치를 샘플링)
+    PROBE_SPACING = 0.2
+    
     def __init__(
         self,
         driver: webdriver.Chrome,
@@ -61,6 +301,9 @@ class HybridReservationBot:
         # 서버 시간 오프셋
         self.server_time_offset: float = 0.0
         
+        # 서버 시간 측정 전용 세션 (keep-alive, 첫 측정 시 생성)
+        self._time_session: Optional[requests.Session] = None
+        
         # 예약 오픈 시간
         self.target_time = datetime.now(KST).replace(
             hour=config.reservation.reservation_open_hour,
@@ -72,6 +315,22 @@ class HybridReservationBot:
         # 선택된 정보 저장
         self.selected_date_str = ""
         self.selected_time_str = ""
+        
+        # 코트 선택 직후 미리 추출한 캡차 PNG data URL (api_get_captcha에서 1회 소비)
+        self._captcha_data_url: Optional[str] = None
+        
+        # 최근 OCR 결과 (캡차 통과 여부), 연속 실패 시 다음 코트로 조기 전환
+        self._ocr_recent: Deque[bool] = deque(maxlen=5)
+        
+        # OCR 엔진 사전 로딩 (PHASE 2 페이지 진입과 병렬로 진행, 첫 solve 전에 합류)
+        self._ocr_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr")
+        self._preload_future: Optional[Future] = None
+        
+        # 마지막으로 Selenium에 반영한 시간 선택 (start_hour, slot_count), 초기화 시 None
+        self._last_selected_slots: Optional[Tuple[int, int]] = None
+        
+        # JS 헬퍼를 새 문서마다 실행하도록 CDP에 등록했는지 여부
+        self._helpers_registered = False
 
         # CLI에서 강제한 새로고침 목표 시각 (KST-aware datetime)
         self.forced_refresh_time: Optional[datetime] = None
@@ -84,6 +343,22 @@ class HybridReservationBot:
                 self.api_base_url = self.api_base_url.split('/online/tennis')[0] + '/online/tennis'
             else:
                 self.api_base_url = self.api_base_url + '/online/tennis'
+        
+        # API URL은 고정값이므로 한 번만 생성 (9시 핫패스에서 문자열 처리 제거)
+        self._url_calendar = self._build_url(self.API_CALENDAR)
+        self._url_time_list = self._build_url(self.API_TIME_LIST)
+        self._url_basket_insert = self._build_url(self.API_BASKET_INSERT)
+    
+    # =========================================================================
+    # 종료 처리
+    # =========================================================================
+    
+    def flush_notifications(self, timeout: float = 15.0) -> None:
+        """대기 중인 Slack 알림 전송을 최대 timeout초 기다린 뒤 워커를 정리합니다."""
+        self._ocr_pool.shutdown(wait=False)
+        self.captcha_solver.close()
+        if self.notifier.flush(timeout):
+            self.notifier.close()
     
     # =========================================================================
     # STEP 1: Selenium - 로그인 및 WebGate 통과
@@ -99,14 +374,14 @@ class HybridReservationBot:
             
             self.logger.info("📝 로그인 정보 입력 중")
             login_id_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.NAME, 'login_id'))
+                EC.presence_of_element_located(_SEL_LOGIN_ID)
             )
             login_id_input.send_keys(self.config.login_id)
-            self.driver.find_element(By.NAME, 'login_pwd').send_keys(self.config.login_password)
+            self.driver.find_element(*_SEL_LOGIN_PWD).send_keys(self.config.login_password)
             
             self.logger.info("🔘 로그인 버튼 클릭")
             button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, '//*[@id="content"]/div/div/div/button'))
+                EC.element_to_be_clickable(_SEL_LOGIN_BUTTON)
             )
             self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
             time.sleep(0.5)
@@ -176,37 +451,76 @@ class HybridReservationBot:
     # STEP 2: 쿠키 추출 및 requests 세션 생성
     # =========================================================================
     
+    def _create_session(self) -> None:
+        """keep-alive 풀과 공통 헤더를 가진 requests 세션을 생성합니다."""
+        self.session = requests.Session()
+        _mount_pooled_adapter(self.session, pool_connections=4, pool_maxsize=8)
+        self.session.headers.update({
+            'User-Agent': self.driver.execute_script("return navigator.userAgent"),
+            'Accept': 'application/json, text/javascript, */*; q=0.01',
+            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            'X-Requested-With': 'XMLHttpRequest',
+            'Referer': self.config.base_url,
+        })
+    
+    def warm_up_connection(self, timeout: float = 3, retry: bool = True) -> None:
+        """
+        API 호스트로 HEAD 요청 1회를 보내 TCP/TLS 연결을 미리 맺어 둡니다.
+        9시 첫 API 호출이 핸드셰이크 없이 풀의 연결을 재사용하도록 합니다 (실패 무시).
+        retry=False면 어댑터 재시도 없이 1회만, 연결+응답 합계 timeout초 안에서 시도합니다.
+        """
+        try:
+            if self.session is None:
+                self._create_session()
+            start_ns = time.monotonic_ns()
+            if retry:
+                self.session.head(self._url_calendar, timeout=timeout)
+            else:
+                # 예열 대상 풀을 가진 세션 어댑터를 그대로 쓰되 이 요청 동안만 Retry(0)
+                # (대기 중에는 메인 스레드 외에 세션을 쓰는 곳이 없음)
+                adapter = self.session.get_adapter(self._url_calendar)
+                saved_retries = adapter.max_retries
+                adapter.max_retries = Retry(0, read=False)
+                try:
+                    self.session.head(self._url_calendar, timeout=(timeout / 2, timeout / 2))
+                finally:
+                    adapter.max_retries = saved_retries
+            self.logger.info(f"🔥 커넥션 예열 완료 ({(time.monotonic_ns() - start_ns) / 1e6:.0f}ms)")
+        except Exception as e:
+            self.logger.info(f"⚠️ 커넥션 예열 실패 (무시): {e}")
+    
     def extract_cookies_to_session(self) -> bool:
         """Selenium 쿠키를 requests 세션으로 복사합니다."""
         try:
             self.logger.info("🍪 Selenium 쿠키 추출 중...")
             
-            # 새 requests 세션 생성
-            self.session = requests.Session()
+            # 예열된 세션이 있으면 그대로 사용 (풀의 연결 재사용)
+            if self.session is None:
+                self._create_session()
             
-            # Selenium 쿠키 가져오기
-            selenium_cookies = self.driver.get_cookies()
+            # 브라우저 쿠키 가져오기 (CDP 1회 호출, 실패 시 WebDriver get_cookies로 대체)
+            # CDP는 모든 도메인의 쿠키를 주지만 jar에 domain을 유지하므로 요청 호스트에 맞는 것만 전송됨
+            try:
+                selenium_cookies = self.driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+            except Exception:
+                selenium_cookies = self.driver.get_cookies()
             
-            # requests 세션에 쿠키 추가
+            # 새 쿠키 jar를 한 번에 구성해 교체 (이전 복사본은 통째로 대체, Selenium이 원본)
+            jar = RequestsCookieJar()
             for cookie in selenium_cookies:
-                self.session.cookies.set(
+                jar.set_cookie(create_cookie(
                     cookie['name'],
                     cookie['value'],
                     domain=cookie.get('domain', ''),
                     path=cookie.get('path', '/')
-                )
-            
-            # 공통 헤더 설정
-            self.session.headers.update({
-                'User-Agent': self.driver.execute_script("return navigator.userAgent"),
-                'Accept': 'application/json, text/javascript, */*; q=0.01',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                'X-Requested-With': 'XMLHttpRequest',
-                'Referer': self.config.base_url,
-            })
+                ))
+            self.session.cookies = jar
             
             self.logger.info(f"✅ {len(selenium_cookies)}개 쿠키 추출 완료")
             
+            # 이후 Selenium 조작에서 쓰는 JS 헬퍼를 미리 설치 (파싱/컴파일 비용을 여기서 지불)
+            self._install_bot_helpers()
+            
             # 쿠키 목록 로깅 (디버그용)
             cookie_names = [c['name'] for c in selenium_cookies]
             self.logger.info(f"   └ 쿠키: {', '.join(cookie_names[:10])}...")
@@ -217,31 +531,65 @@ class HybridReservationBot:
             self.logger.info(f"❌ 쿠키 추출 실패: {e}")
             return False
     
+    def _install_bot_helpers(self) -> None:
+        """JS 헬퍼를 현재 문서에 설치하고, 새로고침/이동 후에도 유지되도록 새 문서용으로 등록합니다."""
+        self.driver.execute_script(_JS_INSTALL_BOT_HELPERS)
+        if self._helpers_registered:
+            return
+        try:
+            self.driver.execute_cdp_cmd(
+                'Page.addScriptToEvaluateOnNewDocument', {'source': _JS_INSTALL_BOT_HELPERS}
+            )
+            self._helpers_registered = True
+        except Exception as e:
+            # 등록 실패 시 현재 문서에서만 동작 (헬퍼가 없으면 각 호출부의 fallback 사용)
+            self.logger.info(f"⚠️ JS 헬퍼 새 문서 등록 실패 (무시): {e}")
+    
     # =========================================================================
     # STEP 3: 서버 시간 측정
     # =========================================================================
     
+    def _probe_server_time_offset(self) -> Optional[float]:
+        """HEAD 요청 1회로 서버-로컬 시간 차이(초)를 측정합니다."""
+        local_before = datetime.now(timezone.utc)
+        response = self._time_session.head(self.config.base_url, timeout=5)
+        local_after = datetime.now(timezone.utc)
+        
+        local_mid = local_before + (local_after - local_before) / 2
+        
+        date_header = response.headers.get('Date')
+        if not date_header:
+            return None
+        server_time = parsedate_to_datetime(date_header)
+        return (server_time - local_mid).total_seconds()
+    
     def measure_server_time_offset(self) -> float:
-        """서버 시간과 로컬 시간의 차이를 측정합니다 (중앙값 사용)."""
+        """서버 시간과 로컬 시간의 차이를 측정합니다 (5회 간격 측정, 중앙값 사용)."""
         try:
             self.logger.info("🕐 서버 시간 측정 중 (5회, 중앙값 사용)...")
             
+            # 같은 소켓을 재사용해 TLS 핸드셰이크 지터가 측정값에 섞이지 않게 함
+            if self._time_session is None:
+                self._time_session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+                self._time_session.mount('https://', adapter)
+                self._time_session.mount('http://', adapter)
+                self._time_session.headers['Connection'] = 'keep-alive'
+            
+            # Date 헤더는 1초 단위이므로 동시에 보낸 샘플은 같은 값만 줌
+            # 측정을 순차로 PROBE_SPACING초씩 띄워 1초 경계의 서로 다른 위치를 샘플링
             offsets = []
             for i in range(5):
-                local_before = datetime.now(timezone.utc)
-                response = requests.head(self.config.base_url, timeout=5)
-                local_after = datetime.now(timezone.utc)
-                
-                local_mid = local_before + (local_after - local_before) / 2
-                
-                date_header = response.headers.get('Date')
-                if date_header:
-                    server_time = parsedate_to_datetime(date_header)
-                    offset = (server_time - local_mid).total_seconds()
+                if i:
+                    time.sleep(self.PROBE_SPACING)
+                try:
+                    offset = self._probe_server_time_offset()
+                except Exception as e:
+                    self.logger.info(f"   측정 {i+1}: 실패 ({e})")
+                    continue
+                if offset is not None:
                     offsets.append(offset)
                     self.logger.info(f"   측정 {i+1}: offset={offset:.3f}초")
-                
-                time.sleep(0.05)
             
             if offsets:
                 sorted_offsets = sorted(offsets)
@@ -293,7 +641,7 @@ class HybridReservationBot:
         if search_date is None:
             search_date = datetime.now(KST).strftime('%Y%m%d')
         
-        url = self._build_url(self.API_CALENDAR)
+        url = self._url_calendar
         params = {
             'search_gubun': 'date',
             'search_date': search_date,
@@ -305,7 +653,7 @@ class HybridReservationBot:
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if data.get('ss_check', 0) > 0 and data.get('calendar_list'):
                 calendar_list = data['calendar_list']
@@ -341,7 +689,7 @@ class HybridReservationBot:
         if not self.session:
             return None
         
-        url = self._build_url(self.API_TIME_LIST)
+        url = self._url_time_list
         params = {
             'search_date': date,
             'search_gubun': 'date',
@@ -355,27 +703,32 @@ class HybridReservationBot:
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if data.get('ss_check', 0) > 0 and data.get('time_list'):
                 time_list = data['time_list']
-                available_slots = []
-                for t in time_list:
-                    tot = int(t.get('totCnt', 0))
-                    end = int(t.get('endCnt', 0))
-                    prog = int(t.get('progCnt', 0))
-                    others = int(t.get('othersCnt', 0))
-                    avail = tot - end - prog - others
-                    if avail > 0:
-                        available_slots.append(f"{t.get('startT')}~{t.get('endT')}(잔여:{avail})")
                 
-                self.logger.info(f"✅ 시간 조회 성공: {len(time_list)}개 슬롯, {len(available_slots)}개 가능")
+                # 카운트 필드를 (N, 4) 배열로 한 번에 변환 후 잔여 수량을 벡터 연산
+                # 열 순서: totCnt, endCnt, progCnt, othersCnt
+                counts = np.array(
+                    [[int(t.get(k, 0)) for k in ('totCnt', 'endCnt', 'progCnt', 'othersCnt')] for t in time_list],
+                    dtype=np.int16,
+                ).reshape(-1, 4)
+                avail = counts[:, 0] - counts[:, 1:].sum(axis=1)
+                available_idx = np.flatnonzero(avail > 0)
+                available_count = len(available_idx)
+                
+                self.logger.info(f"✅ 시간 조회 성공: {len(time_list)}개 슬롯, {available_count}개 가능")
                 
-                # 가용 시간대 출력
-                if available_slots:
-                    self.logger.info(f"   └ 가용 시간: {', '.join(available_slots[:5])}")
-                    if len(available_slots) > 5:
-                        self.logger.info(f"   └ ... 외 {len(available_slots)-5}개 더")
+                # 가용 시간대 출력 (로그에 필요한 앞 5개만 문자열 생성)
+                if available_count:
+                    shown = [
+                        f"{time_list[i].get('startT')}~{time_list[i].get('endT')}(잔여:{avail[i]})"
+                        for i in available_idx[:5].tolist()
+                    ]
+                    self.logger.info(f"   └ 가용 시간: {', '.join(shown)}")
+                    if available_count > 5:
+                        self.logger.info(f"   └ ... 외 {available_count-5}개 더")
                 else:
                     self.logger.info(f"   └ 가용 시간 없음!")
                     # 디버그: 첫 3개 슬롯 정보
@@ -394,45 +747,55 @@ class HybridReservationBot:
     def api_get_captcha(self) -> Optional[Image.Image]:
         """
         캡차 이미지를 가져옵니다.
-        HTTP API로는 캡차가 작동하지 않아서 Selenium으로 가져옵니다.
+        HTTP API로는 캡차가 작동하지 않아서(재요청 시 새 캡차 발급) 브라우저에
+        이미 로드된 이미지를 canvas로 추출합니다.
         
         Returns:
             PIL Image 또는 None
         """
         try:
+            # 코트 클릭 직후 캡차 표시 대기 중에 이미 추출해 둔 이미지가 있으면 바로 사용
+            data_url, self._captcha_data_url = self._captcha_data_url, None
+            if data_url and data_url.startswith('data:image/png;base64,'):
+                captcha_image = Image.open(io.BytesIO(base64.b64decode(data_url.split(',', 1)[1]))).convert('L')
+                self.logger.info(f"✅ 캡차 이미지 캡처 완료 (코트 선택 중 추출): {captcha_image.size}")
+                return captcha_image
+            
             self.logger.info(f"🔐 캡차 이미지 가져오기 (Selenium)")
             
-            # 캡차 wrap 존재 확인
+            # 캡차 wrap 존재/표시 여부 확인 (find_element + is_displayed 2회 왕복 대신 스크립트 1회)
             try:
-                captcha_wrap = self.driver.find_element(By.ID, 'layer_captcha_wrap')
-                self.logger.info(f"   └ 캡차 wrap 발견: {captcha_wrap.is_displayed()}")
+                wrap_visible = self.driver.execute_script(_JS_CAPTCHA_WRAP_VISIBLE)
+                if wrap_visible is None:
+                    self.logger.info(f"   └ 캡차 wrap 없음")
+                else:
+                    self.logger.info(f"   └ 캡차 wrap 발견: {wrap_visible}")
             except Exception as e:
-                self.logger.info(f"   └ 캡차 wrap 없음: {e}")
+                self.logger.info(f"   └ 캡차 wrap 확인 실패: {e}")
             
             # 캡차 이미지 요소 찾기
             self.logger.info(f"   └ 캡차 이미지 요소 대기 중...")
             captcha_element = WebDriverWait(self.driver, 10).until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, '//*[@id="layer_captcha_wrap"]/div/img')
-                )
+                EC.visibility_of_element_located(_SEL_CAPTCHA_IMG)
             )
             self.logger.info(f"   └ 캡차 이미지 요소 발견!")
             
-            # 이미지가 완전히 로드될 때까지 대기
-            for i in range(10):
-                try:
-                    size = captcha_element.size
-                    if size['width'] > 0 and size['height'] > 0:
-                        self.logger.info(f"   └ 이미지 크기: {size}")
-                        break
-                except Exception:
-                    pass
-                time.sleep(0.2)
-            
-            time.sleep(0.3)  # 안전을 위한 추가 대기
+            # 이미지 디코딩 완료까지 대기 (complete && naturalWidth > 0)
+            WebDriverWait(self.driver, 2, poll_frequency=0.05).until(
+                lambda d: d.execute_script(_JS_IMG_LOADED, captcha_element)
+            )
             
-            # 스크린샷으로 캡차 이미지 가져오기
-            captcha_image = Image.open(io.BytesIO(captcha_element.screenshot_as_png))
+            # 브라우저에 이미 로드된 이미지를 canvas로 추출 (서버 재요청 없음 → 캡차 유지)
+            # 실패 시(canvas 오염 등)에만 요소 스크린샷으로 대체
+            data_url = self.driver.execute_script(_JS_IMG_TO_DATA_URL, captcha_element)
+            if data_url and data_url.startswith('data:image/png;base64,'):
+                png_bytes = base64.b64decode(data_url.split(',', 1)[1])
+            else:
+                self.logger.info("   └ canvas 추출 실패, 스크린샷으로 대체")
+                png_bytes = captcha_element.screenshot_as_png
+            # 캡처 경계에서 한 번만 그레이스케일(L, uint8)로 변환
+            # → OCR 엔진마다 RGB(A)를 다시 변환/인코딩하지 않음 (ddddocr PNG 인코딩도 1채널로 축소)
+            captcha_image = Image.open(io.BytesIO(png_bytes)).convert('L')
             self.logger.info(f"✅ 캡차 이미지 캡처 완료: {captcha_image.size}")
             return captcha_image
             
@@ -449,7 +812,8 @@ class HybridReservationBot:
         court_no: int,
         start_times: List[str],
         end_times: List[str],
-        captcha: str
+        captcha: str,
+        contention_retries: int = 2
     ) -> Tuple[bool, str, int]:
         """
         장바구니에 예약을 추가합니다 (핵심 예약 API!).
@@ -461,6 +825,7 @@ class HybridReservationBot:
             start_times: 시작 시간 배열 (예: ["19:00", "20:00"])
             end_times: 종료 시간 배열 (예: ["20:00", "21:00"])
             captcha: 캡차 입력값
+            contention_retries: 다른 사용자 진행중(5, 9) 응답 시 재요청 횟수 (POST는 최대 1 + 이 값)
             
         Returns:
             Tuple of (success, message, validity_no)
@@ -468,7 +833,7 @@ class HybridReservationBot:
         if not self.session:
             return False, "세션 없음", -1
         
-        url = self._build_url(self.API_BASKET_INSERT)
+        url = self._url_basket_insert
         
         payload = {
             "search_date": xdate,  # 암호화된 날짜!
@@ -483,21 +848,38 @@ class HybridReservationBot:
         
         try:
             self.logger.info(f"🛒 장바구니 API 호출: 코트 {court_no}, {start_times[0]}~{end_times[-1]}")
-            self.logger.info(f"   └ payload: {json.dumps(payload, ensure_ascii=False)[:200]}...")
-            
-            response = self.session.post(
-                url,
-                json=payload,
-                headers={'Content-Type': 'application/json; charset=utf-8'},
-                timeout=15
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            ss_check = data.get('ss_check', 0)
-            validity_no = data.get('validity_no', -1)
-            
-            self.logger.info(f"📦 응답: ss_check={ss_check}, validity_no={validity_no}")
+            # 한 번만 직렬화해서 로그와 요청 본문에 같이 사용 (orjson은 비ASCII를 그대로 UTF-8로 출력)
+            body = orjson.dumps(payload)
+            self.logger.info(f"   └ payload: {body.decode('utf-8')[:200]}...")
+            
+            # "다른 사용자가 예약 진행중"이면 같은 본문으로 짧은 간격 재요청
+            # (세션 풀의 keep-alive 연결 재사용, 응답 본문을 바로 읽어 연결 반환)
+            for retry in range(contention_retries + 1):
+                if retry:
+                    time.sleep(0.05 * retry)
+                    self.logger.info(f"🔁 경합 응답({validity_no}), 장바구니 재요청 {retry}/{contention_retries}")
+                
+                response = self.session.post(
+                    url,
+                    data=body,
+                    headers=_JSON_HEADERS,
+                    timeout=15
+                )
+                response.raise_for_status()
+                
+                data = orjson.loads(response.content)
+                ss_check = data.get('ss_check', 0)
+                validity_no = data.get('validity_no', -1)
+                
+                self.logger.info(f"📦 응답: ss_check={ss_check}, validity_no={validity_no}")
+                
+                # 재요청에서 캡차 오류 → 같은 답은 더 쓸 수 없으므로 호출부가 캡차를 새로 받아 다시 풀도록 반환
+                if retry and _is_captcha_error(response.text):
+                    self.logger.info("⚠️ 경합 재요청 중 캡차 오류 - 첫 요청에서 캡차가 소모됨")
+                    return False, _CAPTCHA_CONSUMED_MSG, validity_no
+                
+                if not (ss_check > 0 and validity_no in _BASKET_CONTENTION_CODES):
+                    break
             
             if ss_check > 0 and validity_no == 0:
                 self.logger.info("✅ 장바구니 추가 성공!")
@@ -538,22 +920,44 @@ class HybridReservationBot:
     def wait_for_reservation_open(self) -> None:
         """로컬 시간과 서버 오프셋을 고려하여 정밀하게 페이지를 새로고침합니다."""
         now = datetime.now(KST)
+        # 벽시계는 여기서 한 번만 읽고, 이후 모든 남은 시간 계산은 monotonic 기준
+        # (대기 중 NTP 보정으로 벽시계가 튀어도 데드라인이 흔들리지 않음)
+        wall_anchor = now.timestamp()
+        mono_anchor_ns = time.monotonic_ns()
+
+        def _deadline_ns(target_ts: float) -> int:
+            return mono_anchor_ns + int((target_ts - wall_anchor) * 1e9)
 
         def _wait_until(target_ts: float) -> None:
-            remain = target_ts - time.time()
+            deadline_ns = _deadline_ns(target_ts)
+            remain = (deadline_ns - time.monotonic_ns()) / 1e9
             if remain > 0:
                 if remain > 5:
-                    self.logger.info("💤 목표 시각 2초 전까지 대기 중...")
-                    time.sleep(remain - 2)
+                    if remain > 10:
+                        self.logger.info("💤 목표 시각 10초 전까지 대기 중...")
+                        time.sleep(remain - 10)
+                    # 대기 중 유휴 연결이 서버에서 끊겼을 수 있으므로 T-10초에 재예열
+                    # (재시도 없이, 목표 2초 전까지 남은 여유 안에서만)
+                    margin = (deadline_ns - time.monotonic_ns()) / 1e9 - 2
+                    if margin > 0.1:
+                        self.warm_up_connection(timeout=min(1.0, margin), retry=False)
+                    remain = (deadline_ns - time.monotonic_ns()) / 1e9
+                    if remain > 2:
+                        self.logger.info("💤 목표 시각 2초 전까지 대기 중...")
+                        time.sleep(remain - 2)
                 self.logger.info("🎯 마지막 2초 정밀 대기...")
-                while time.time() < target_ts:
-                    time.sleep(0.0001)
+                # datetime 생성 없이 정수 비교만 수행, sleep(0)으로 GIL만 양보
+                while time.monotonic_ns() < deadline_ns:
+                    time.sleep(0)
 
         def _fire_refresh(tag: str) -> None:
-            self.logger.info(f"🔄 새로고침 실행 ({tag}) @ {datetime.now(KST).strftime('%H:%M:%S.%f')[:-3]}")
+            # 발사 시각만 기록하고, 포맷팅/stdout 출력은 새로고침 요청 이후로 미룸
+            fired_at = time.time()
             try:
                 self.driver.execute_script(
-                    "window.onbeforeunload = null; alert = str => { }; confirm = str => { return true; };"
+                    # __preRefresh: 새로고침 전 문서 표시 (page_load_strategy='none'이라 reload 직후엔 이전 DOM이 남아 있음)
+                    "window.__preRefresh = true; window.onbeforeunload = null; "
+                    "alert = str => { }; confirm = str => { return true; };"
                 )
                 try:
                     self.driver.switch_to.alert.accept()
@@ -568,6 +972,9 @@ class HybridReservationBot:
                     self.driver.refresh()
                 except Exception as e2:
                     self.logger.info(f"⚠️ driver.refresh()도 실패({tag}): {e2}")
+            self.logger.info(
+                f"🔄 새로고침 실행 ({tag}) @ {datetime.fromtimestamp(fired_at, KST).strftime('%H:%M:%S.%f')[:-3]}"
+            )
 
         def _is_queue_or_ready_state() -> bool:
             """
@@ -576,12 +983,8 @@ class HybridReservationBot:
             - WebGate 대기열 화면(예: '대기 xx팀' 텍스트) 표시
             """
             try:
-                if len(self.driver.find_elements(By.ID, "tab_by_date")) > 0:
-                    return True
-
-                body_text = self.driver.find_element(By.TAG_NAME, "body").text
-                queue_keywords = ("대기", "팀", "webgate", "WebGate")
-                return any(keyword in body_text for keyword in queue_keywords)
+                # 본문 텍스트 전체를 WebDriver로 전송하지 않고 브라우저 안에서 판별
+                return bool(self.driver.execute_script(_JS_QUEUE_OR_READY))
             except Exception:
                 return False
 
@@ -616,7 +1019,7 @@ class HybridReservationBot:
         # 2) 1차 새로고침
         did_primary_refresh = False
         primary_ts = primary_target.timestamp()
-        if primary_ts > time.time():
+        if _deadline_ns(primary_ts) > time.monotonic_ns():
             _wait_until(primary_ts)
             _fire_refresh("1차")
             did_primary_refresh = True
@@ -634,22 +1037,27 @@ class HybridReservationBot:
         # 3) 2차 새로고침 (forced time 테스트 모드에서는 생략)
         if secondary_target is not None:
             secondary_ts = secondary_target.timestamp()
-            if secondary_ts > time.time():
+            if _deadline_ns(secondary_ts) > time.monotonic_ns():
                 _wait_until(secondary_ts)
                 _fire_refresh("2차")
             else:
                 self.logger.info("⚠️ 2차 목표 시각이 이미 지나 2차 새로고침 생략")
-
-        # 4. WebGate 대기열 통과 대기
+    
+    def wait_for_webgate(self) -> None:
+        """새로고침 이후 WebGate 대기열을 통과해 예약 페이지가 뜰 때까지 대기합니다."""
         self.logger.info("⏳ WebGate 대기열 및 페이지 로딩 대기 중...")
-        try:
-            # tab_by_date가 나타날 때까지 대기
-            WebDriverWait(self.driver, 300).until(
-                EC.presence_of_element_located((By.ID, 'tab_by_date'))
-            )
-            self.logger.info("✅ 페이지 진입 성공!")
-        except Exception as e:
-            self.logger.info(f"⚠️ 대기 중 오류 발생 (계속 진행): {e}")
+        # 0.5초 간격 find_element 폴링 대신 브라우저 안의 MutationObserver가 tab_by_date 등장 즉시 응답
+        # (최대 5초 단위로 호출, 대기열 → 예약 페이지 이동으로 스크립트가 끊기면 새 문서에서 재설치)
+        deadline_ns = time.monotonic_ns() + 300 * 1_000_000_000
+        while time.monotonic_ns() < deadline_ns:
+            try:
+                if self.driver.execute_async_script(_JS_WAIT_FOR_TAB_BY_DATE, 5000):
+                    self.logger.info("✅ 페이지 진입 성공!")
+                    return
+            except Exception:
+                # 페이지 이동 중 스크립트 중단 등 → 잠시 후 재시도
+                time.sleep(0.05)
+        self.logger.info("⚠️ 대기 중 오류 발생 (계속 진행): WebGate 대기 시간 초과")
 
     
     def find_available_slots(
@@ -671,45 +1079,116 @@ class HybridReservationBot:
         """
         available_slots = []
         
-        # 시간대별로 그룹화 및 가용성 확인
-        for i in range(len(time_list) - slot_count + 1):
+        n = len(time_list)
+        if slot_count <= 0 or n < slot_count:
+            return available_slots
+        
+        # 슬롯 필드를 한 번만 파싱해 연속 배열(SoA)로 변환
+        tot = np.fromiter((int(t.get('totCnt', 0)) for t in time_list), dtype=np.int16, count=n)
+        end = np.fromiter((int(t.get('endCnt', 0)) for t in time_list), dtype=np.int16, count=n)
+        prog = np.fromiter((int(t.get('progCnt', 0)) for t in time_list), dtype=np.int16, count=n)
+        use_yn = np.fromiter((t.get('useYn') == 'Y' for t in time_list), dtype=np.bool_, count=n)
+        good = use_yn & ((tot - end - prog) > 0)
+        
+        # 길이 slot_count 윈도우의 가용 슬롯 수 == slot_count 인 시작 인덱스만 추출
+        window_counts = np.convolve(good.astype(np.int16), np.ones(slot_count, dtype=np.int16), mode='valid')
+        valid_starts = np.flatnonzero(window_counts == slot_count)
+        
+        for i in valid_starts.tolist():
             slots = time_list[i:i + slot_count]
             
-            # 모든 슬롯이 사용 가능한지 확인
-            all_available = all(
-                slot.get('useYn') == 'Y' and 
-                (int(slot.get('totCnt', 0)) - int(slot.get('endCnt', 0)) - int(slot.get('progCnt', 0))) > 0
-                for slot in slots
-            )
-            
-            if all_available:
-                start_times = [slot.get('startT', '') for slot in slots]
-                end_times = [slot.get('endT', '') for slot in slots]
-                hour = int(start_times[0].split(':')[0]) if start_times[0] else 0
+            start_times = [slot.get('startT', '') for slot in slots]
+            end_times = [slot.get('endT', '') for slot in slots]
+            hour = int(start_times[0].split(':')[0]) if start_times[0] else 0
+            
+            # 각 선호 코트에 대해 가용성 확인
+            for court in preferred_courts:
+                # 해당 코트가 모든 슬롯에서 가능한지 확인
+                court_available = True
+                for slot in slots:
+                    court_no = slot.get('courtNo')
+                    if court_no and int(court_no) != court:
+                        continue
+                    # 코트별 상세 확인이 필요한 경우 추가 API 호출 필요
                 
-                # 각 선호 코트에 대해 가용성 확인
-                for court in preferred_courts:
-                    # 해당 코트가 모든 슬롯에서 가능한지 확인
-                    court_available = True
-                    for slot in slots:
-                        court_no = slot.get('courtNo')
-                        if court_no and int(court_no) != court:
-                            continue
-                        # 코트별 상세 확인이 필요한 경우 추가 API 호출 필요
-                    
-                    if court_available:
-                        available_slots.append({
-                            'hour': hour,
-                            'start_times': start_times,
-                            'end_times': end_times,
-                            'court': court
-                        })
+                if court_available:
+                    available_slots.append({
+                        'hour': hour,
+                        'start_times': start_times,
+                        'end_times': end_times,
+                        'court': court
+                    })
         
         # 늦은 시간대부터 정렬
         available_slots.sort(key=lambda x: x['hour'], reverse=True)
         
         return available_slots
     
+    def _iter_time_slot_candidates(self, time_list: List[Dict], strategy: ReservationStrategy) -> Iterator[Dict]:
+        """
+        전략에 맞는 연속 가용 시간대 후보를 시도 순서대로 하나씩 생성합니다.
+        
+        Args:
+            time_list: 시간 API 응답의 time_list
+            strategy: 예약 전략 (target_hour 또는 auto_find_latest)
+            
+        Yields:
+            {start_hour, start_times, end_times}
+        """
+        slot_count = strategy.time_slot_count
+        
+        # 슬롯별 잔여 수량을 한 번만 계산하고, 길이 slot_count 윈도우의 최소값 > 0 으로
+        # "모든 슬롯 가용" 여부를 윈도우 시작 인덱스별 bool 배열로 미리 구함
+        remaining = np.array(
+            [
+                int(t.get('totCnt', 0)) - int(t.get('endCnt', 0))
+                - int(t.get('progCnt', 0)) - int(t.get('othersCnt', 0))
+                for t in time_list
+            ],
+            dtype=np.int16,
+        )
+        if 0 < slot_count <= len(remaining):
+            window_available = sliding_window_view(remaining, slot_count).min(axis=1) > 0
+        else:
+            window_available = np.zeros(0, dtype=np.bool_)
+        
+        # 슬롯별 시작 시(hour)를 한 번만 파싱 (startT 없으면 -1)
+        slot_hours = np.fromiter(
+            (int(t['startT'].split(':')[0]) if t.get('startT') else -1 for t in time_list),
+            dtype=np.int16,
+            count=len(time_list),
+        )
+        window_count = len(window_available)
+        
+        # target_hour가 지정된 경우: 해당 시간대만 확인
+        # auto_find_latest=True인 경우: 가장 늦은 시간부터 역순으로 탐색
+        if strategy.auto_find_latest:
+            # 3순위: 가장 늦은 시간부터 역순 탐색
+            self.logger.info(f"   └ 가장 늦은 연속 시간대 탐색 모드")
+            search_range = range(window_count - 1, -1, -1)
+        else:
+            # 1, 2순위: 첫 슬롯이 target_hour인 윈도우 시작 인덱스만 직접 조회
+            self.logger.info(f"   └ 특정 시간대({strategy.target_hour}시) 탐색 모드")
+            search_range = np.flatnonzero(slot_hours[:window_count] == strategy.target_hour).tolist()
+        
+        for i in search_range:
+            # 모든 슬롯의 가용 수량 확인 (미리 계산한 윈도우 결과 조회)
+            if not window_available[i]:
+                continue
+            slots = time_list[i:i + slot_count]
+            start_times = [slot.get('startT', '') for slot in slots]
+            end_times = [slot.get('endT', '') for slot in slots]
+            if all(start_times) and all(end_times):
+                yield {
+                    'start_hour': int(slot_hours[i]),
+                    'start_times': start_times,
+                    'end_times': end_times
+                }
+                
+                # target_hour가 지정된 경우 정확히 하나만 찾으면 됨
+                if not strategy.auto_find_latest:
+                    return
+    
     def select_date_with_selenium(self, target_date: str) -> bool:
         """
         Selenium으로 날짜를 선택합니다.
@@ -726,48 +1205,25 @@ class HybridReservationBot:
             # WebGate 통과 후 페이지 안정화 대기
             self.logger.info("   └ 페이지 안정화 대기...")
             WebDriverWait(self.driver, 10).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
+                lambda d: d.execute_script(_JS_READY_STATE) == "complete"
             )
             time.sleep(0.5)  # 추가 안정화 시간
             
-            # Stale element 방지: 최대 3회 재시도
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    # 예약 가능한 날짜 링크 찾기 (매번 새로 찾기!)
-                    clickable_dates = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_all_elements_located((
-                            By.XPATH,
-                            "//tbody//a[starts-with(@href, 'javascript:fn_tennis_time_list')]"
-                        ))
-                    )
-                    
-                    self.logger.info(f"   └ 클릭 가능한 날짜: {len(clickable_dates)}개")
-                    
-                    if not clickable_dates:
-                        self.logger.info("❌ 클릭 가능한 날짜가 없음")
-                        return False
-                    
-                    # 마지막 날짜 클릭 (가장 나중 날짜)
-                    target = clickable_dates[-1]
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", target)
-                    time.sleep(0.1)
-                    self.driver.execute_script("arguments[0].click();", target)
-                    
-                    self.logger.info(f"✅ 날짜 클릭 완료")
-                    break  # 성공하면 루프 탈출
-                    
-                except StaleElementReferenceException:
-                    if attempt < max_retries - 1:
-                        self.logger.info(f"   └ Element stale, 재시도 {attempt + 1}/{max_retries}")
-                        time.sleep(0.3)
-                    else:
-                        raise  # 마지막 시도에서도 실패하면 예외 발생
+            # 날짜 링크 href가 곧 호출할 JS이므로 element를 다루지 않고 문자열만 한 번에 읽음
+            # (scroll/click/stale element 재시도 불필요)
+            date_hrefs = WebDriverWait(self.driver, 10).until(
+                lambda d: d.execute_script(_JS_DATE_LINK_HREFS) or None
+            )
+            self.logger.info(f"   └ 클릭 가능한 날짜: {len(date_hrefs)}개")
+            
+            # 마지막 날짜 (가장 나중 날짜) 함수 직접 호출
+            self.driver.execute_script(date_hrefs[-1][len('javascript:'):])
+            self.logger.info(f"✅ 날짜 선택 완료")
             
             # 시간 슬롯 로딩 대기
             self.logger.info(f"   └ 시간 슬롯 로딩 대기 중...")
             WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'ul#time_con li'))
+                EC.presence_of_all_elements_located(_SEL_TIME_SLOTS)
             )
             time.sleep(0.5)
             
@@ -788,32 +1244,12 @@ class HybridReservationBot:
         Returns:
             가용한 코트 번호 목록
         """
-        available = []
-        
-        # implicit wait 일시적으로 비활성화 (빠른 확인)
-        original_wait = self.driver.timeouts.implicit_wait
-        self.driver.implicitly_wait(0)
-        
+        # 코트별 find_element/get_attribute 왕복(코트당 3회) 대신 스크립트 1회로 판별
         try:
-            for court_num in preferred_courts:
-                try:
-                    court_id = f'tennis_court_img_a_1_{court_num}'
-                    courts = self.driver.find_elements(By.ID, court_id)
-                    if not courts:
-                        continue
-                    court = courts[0]
-                    img_elements = court.find_elements(By.TAG_NAME, 'img')
-                    if not img_elements:
-                        continue
-                    # btn_tennis_noreserve = 예약 불가 이미지
-                    if 'btn_tennis_noreserve' not in img_elements[0].get_attribute('src'):
-                        available.append(court_num)
-                except Exception:
-                    continue
-        finally:
-            self.driver.implicitly_wait(original_wait)
-        
-        return available
+            return self.driver.execute_script(_JS_AVAILABLE_COURTS, list(preferred_courts)) or []
+        except Exception as e:
+            self.logger.info(f"⚠️ 가용 코트 확인 오류: {e}")
+            return []
     
     def select_time_with_selenium(
         self,
@@ -835,60 +1271,40 @@ class HybridReservationBot:
         try:
             # 시간 슬롯 선택
             base_hour = 6  # 06시 = index 0
+            target_indices = set(range(start_hour - base_hour, start_hour - base_hour + slot_count))
             
-            time_slots = self.driver.find_elements(By.CSS_SELECTOR, 'ul#time_con li')
-            
-            if len(time_slots) == 0:
+            # 직전에 같은 시간을 반영했고 DOM의 체크 상태도 그대로면 클릭 없이 코트만 확인
+            # (페이지 쪽 초기화로 체크가 풀렸을 수 있으므로 캐시만 믿지 않고 1회 확인)
+            if self._last_selected_slots == (start_hour, slot_count):
+                if self._get_checked_indices() == target_indices:
+                    self.logger.info(f"   └ {start_hour}시~{start_hour+slot_count}시 이미 선택됨 (캐시)")
+                    available_courts = self.get_available_courts_selenium(preferred_courts)
+                    self.logger.info(f"⏰ {start_hour}시~{start_hour+slot_count}시 → 가용 코트: {available_courts if available_courts else '없음'}")
+                    return True, available_courts
+                self.logger.info("   └ 캐시된 시간 선택이 페이지에서 해제됨 - 다시 선택")
+                self._last_selected_slots = None
+            
+            # 슬롯 조회 → 현재 체크 상태 비교 → 변경분 클릭을 브라우저 안에서 한 번에 수행
+            state = self.driver.execute_script(_JS_SELECT_TIME_SLOTS, sorted(target_indices))
+            
+            if state['slotCount'] == 0:
                 self.logger.info(f"❌ 시간 슬롯이 없음!")
                 return False, []
+            if not state['inRange']:
+                self.logger.info(f"❌ 시간 슬롯 인덱스 범위 초과")
+                return False, []
             
-            # 현재 선택된 슬롯 확인 (변경이 필요한지 체크)
-            target_indices = set(range(start_hour - base_hour, start_hour - base_hour + slot_count))
-            currently_selected = set()
-            
-            for idx, slot in enumerate(time_slots):
-                try:
-                    checkbox = slot.find_element(By.CSS_SELECTOR, 'input[type="checkbox"]')
-                    if checkbox.is_selected():
-                        currently_selected.add(idx)
-                except Exception:
-                    pass
-            
-            # 이미 원하는 시간이 선택되어 있으면 스킵
-            if currently_selected == target_indices:
+            if not state['changed']:
                 self.logger.info(f"   └ {start_hour}시~{start_hour+slot_count}시 이미 선택됨")
             else:
-                # 다른 시간이 선택되어 있으면 먼저 해제
-                for idx in currently_selected - target_indices:
-                    try:
-                        slot = time_slots[idx]
-                        checkbox = slot.find_element(By.CSS_SELECTOR, 'input[type="checkbox"]')
-                        self.driver.execute_script("arguments[0].click();", checkbox)
-                        try:
-                            alert = self.driver.switch_to.alert
-                            alert.accept()
-                        except NoAlertPresentException:
-                            pass
-                    except Exception:
-                        pass
+                for alert_text in state['alerts']:
+                    self.logger.info(f"   └ 시간 선택 알림: {alert_text}")
+                self._drain_alerts()
                 
-                # 원하는 시간 선택
-                for i in range(slot_count):
-                    slot_index = start_hour - base_hour + i
-                    
-                    if slot_index >= len(time_slots):
-                        self.logger.info(f"❌ 시간 슬롯 인덱스 범위 초과")
-                        return False, []
-                    
-                    slot = time_slots[slot_index]
-                    checkbox = slot.find_element(By.CSS_SELECTOR, 'input[type="checkbox"]')
-                    
-                    if not checkbox.is_selected():
-                        self.driver.execute_script("arguments[0].click();", checkbox)
-                        time.sleep(0.15)
-            
-            # 코트 상태 업데이트 대기
-            time.sleep(0.3)
+                # 고정 sleep 대신 체크 상태 반영 → 코트 이미지 갱신을 조건 대기
+                self._wait_checkboxes_match(target_indices)
+                self._wait_court_images_change(state['courtSignature'])
+            self._last_selected_slots = (start_hour, slot_count)
             
             # 가용 코트 확인
             available_courts = self.get_available_courts_selenium(preferred_courts)
@@ -913,27 +1329,32 @@ class HybridReservationBot:
         try:
             self.logger.info(f"🎾 코트 {court_no} 선택 중...")
             
-            court_id = f'tennis_court_img_a_1_{court_no}'
-            court = self.driver.find_element(By.ID, court_id)
-            self.driver.execute_script("arguments[0].click();", court)
+            court = self.driver.find_element(By.ID, COURT_IDS[court_no])
+            # 클릭 전 캡차 로드 횟수를 기억해 두고, 클릭 후에는 새로 로드된 캡차만 인정
+            # (다른 경로에서 기록된 alert가 이번 클릭 결과로 읽히지 않도록 함께 비움)
+            previous_loads = self.driver.execute_script(_JS_BEFORE_COURT_CLICK)
+            self.driver.execute_script(_JS_CLICK, court)
+            
+            # Alert 또는 캡차 표시 중 먼저 오는 쪽까지 대기 (고정 0.3초 + 0.5초 sleep 대체)
+            ready, alert_text = self._wait_court_click_outcome(previous_loads=previous_loads)
+            if not ready:
+                # 후킹이 없는 상태에서 네이티브 alert가 떠 있는 경우만 직접 확인
+                try:
+                    alert = self.driver.switch_to.alert
+                    alert_text = alert.text
+                    alert.accept()
+                except NoAlertPresentException:
+                    pass
             
             # Alert 처리
-            try:
-                time.sleep(0.3)
-                alert = self.driver.switch_to.alert
-                alert_text = alert.text
+            if alert_text:
                 if "예약이 완료된 코트입니다" in alert_text or "예약이 불가" in alert_text:
-                    alert.accept()
                     self.logger.info(f"❌ 코트 {court_no} 예약 불가: {alert_text}")
                     return False
-                alert.accept()
-            except NoAlertPresentException:
-                pass
+                # 안내성 alert였다면 캡차 표시까지 이어서 대기
+                self._wait_for_captcha_img(previous_loads=previous_loads)
             
             self.logger.info(f"✅ 코트 {court_no} 선택 완료!")
-            
-            # 캡차 표시 대기
-            time.sleep(0.5)
             return True
             
         except Exception as e:
@@ -960,22 +1381,25 @@ class HybridReservationBot:
         
         return self.select_court_with_selenium(court_no)
     
+    def _drain_alerts(self) -> None:
+        """열려 있는 alert를 모두 닫습니다."""
+        while True:
+            try:
+                self.driver.switch_to.alert.accept()
+            except NoAlertPresentException:
+                return
+    
+    def _get_checked_indices(self) -> set:
+        """체크된 시간 슬롯(ul#time_con li) 인덱스를 스크립트 1회로 조회합니다."""
+        return set(self.driver.execute_script(_JS_CHECKED_TIME_INDICES) or ())
+    
     def clear_selenium_selections(self) -> None:
         """Selenium에서 선택된 시간 슬롯을 초기화합니다."""
+        self._last_selected_slots = None
         try:
-            time_slots = self.driver.find_elements(By.CSS_SELECTOR, 'ul#time_con li')
-            for slot in time_slots:
-                try:
-                    checkbox = slot.find_element(By.CSS_SELECTOR, 'input[type="checkbox"]')
-                    if checkbox.is_selected():
-                        self.driver.execute_script("arguments[0].click();", checkbox)
-                        try:
-                            alert = self.driver.switch_to.alert
-                            alert.accept()
-                        except NoAlertPresentException:
-                            pass
-                except Exception:
-                    continue
+            # 체크된 슬롯 조회와 해제를 스크립트 1회로 처리
+            self.driver.execute_script(_JS_TOGGLE_TIME_INDICES, None)
+            self._drain_alerts()
         except Exception:
             pass
     
@@ -996,6 +1420,10 @@ class HybridReservationBot:
         
         Returns:
             Tuple of (success, message)
+        
+        종료 시 시간 선택을 해제하지 않습니다 (성공하면 run()이 바로 끝나고, 실패하면 다음
+        select_time_with_selenium이 현재 체크 상태와의 차이만 반영). 대신 선택 캐시만 무효화해
+        다음 호출이 실제 DOM 상태를 다시 확인하도록 합니다.
         """
         for attempt in range(1, max_captcha_retries + 1):
             self.logger.info(f"🔄 예약 시도 {attempt}/{max_captcha_retries}")
@@ -1008,10 +1436,16 @@ class HybridReservationBot:
                     self._refresh_captcha_selenium()
                 continue
             
-            # 2. 캡차 풀기
+            # 2. 캡차 풀기 (사전 로딩이 아직 진행 중이면 완료 대기)
+            if self._preload_future is not None:
+                self._preload_future.result()
+                self._preload_future = None
             captcha_result = self.captcha_solver.solve(captcha_image)
             if not captcha_result:
                 self.logger.info("❌ 캡차 인식 실패")
+                self._ocr_recent.append(False)
+                if self._ocr_streak_failed():
+                    break
                 if attempt < max_captcha_retries:
                     self._refresh_captcha_selenium()
                 continue
@@ -1029,34 +1463,137 @@ class HybridReservationBot:
             )
             
             if success:
-                self.clear_selenium_selections()
+                self._ocr_recent.append(True)
+                self._last_selected_slots = None
                 return True, message
             
+            # 경합 재요청 중 캡차가 소모됨 → OCR 오답이 아니므로 기록/캐시는 그대로 두고 새 캡차로 재시도
+            if message == _CAPTCHA_CONSUMED_MSG:
+                if attempt < max_captcha_retries:
+                    self._refresh_captcha_selenium()
+                continue
+            
             # 캡차 오류면 재시도
-            if "captcha" in message.lower() or "자동입력" in message:
+            if _is_captcha_error(message):
+                self._ocr_recent.append(False)
+                self.captcha_solver.forget_last()
+                if self._ocr_streak_failed():
+                    break
                 self.logger.info(f"⚠️ 캡차 오류, 재시도...")
                 if attempt < max_captcha_retries:
                     self._refresh_captcha_selenium()
                 continue
             
-            # 다른 오류면 중단
-            self.clear_selenium_selections()
+            # 다른 오류면 중단 (캡차 정답 여부를 알 수 없으므로 OCR 기록에는 반영하지 않음)
+            self._last_selected_slots = None
             return False, message
+        else:
+            self._last_selected_slots = None
+            return False, f"캡차 {max_captcha_retries}회 시도 실패"
         
-        self.clear_selenium_selections()
-        return False, f"캡차 {max_captcha_retries}회 시도 실패"
+        # 최근 OCR이 연속 실패 → 이 캡차 유형에 계속 시간을 쓰지 않고 다음 코트로
+        self._last_selected_slots = None
+        return False, "OCR 연속 실패"
+    
+    def _ocr_streak_failed(self) -> bool:
+        """최근 3회 이상 OCR 결과가 모두 실패(인식 실패 또는 캡차 오답)였는지 확인합니다."""
+        if len(self._ocr_recent) >= 3 and not any(self._ocr_recent):
+            self.logger.info(f"⛔ 최근 {len(self._ocr_recent)}회 OCR 연속 실패, 다음 코트로 이동")
+            return True
+        return False
     
     def _refresh_captcha_selenium(self) -> None:
         """Selenium으로 캡차를 새로고침합니다."""
+        self._captcha_data_url = None
         try:
-            refresh_btn = self.driver.find_element(
-                By.XPATH, '//*[@id="layer_captcha_wrap"]//input[@value="새로고침"]'
-            )
-            refresh_btn.click()
-            time.sleep(0.5)
+            # 버튼 탐색(XPath) + 현재 src 조회 + 클릭을 ID 기준 CSS 셀렉터로 스크립트 1회에 처리
+            old_src = self.driver.execute_script(_JS_CLICK_CAPTCHA_REFRESH)
+            if old_src is False:
+                return
+            # 새 이미지(src 변경) 로드 완료까지 대기, 최대 기존 고정 대기(0.5초)만큼
+            try:
+                WebDriverWait(self.driver, 0.5, poll_frequency=0.05).until(
+                    lambda d: d.execute_script(_JS_CAPTCHA_IMG_SRC) != old_src
+                    and d.execute_script(_JS_CAPTCHA_IMG_READY)
+                )
+            except TimeoutException:
+                pass
         except Exception:
             pass
     
+    def _wait_checkboxes_match(self, target_indices: set, timeout: float = 1.0) -> bool:
+        """체크된 시간 슬롯이 target_indices와 같아질 때까지 대기합니다."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda d: self._get_checked_indices() == target_indices
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _wait_court_images_change(self, previous_signature: str, timeout: float = 0.3) -> bool:
+        """
+        코트 이미지(src)가 갱신될 때까지 대기합니다.
+        가용 상태가 그대로면 갱신이 없으므로 최대 기존 고정 대기(0.3초)만큼만 기다립니다.
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda d: d.execute_script(_JS_COURT_IMG_SIGNATURE) != previous_signature
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _wait_for_captcha_img(self, timeout: float = 2.0, previous_loads: Optional[int] = None) -> bool:
+        """캡차 이미지가 표시·로드될 때까지 대기합니다 (previous_loads가 주어지면 그 뒤에 새로 로드된 이미지만)."""
+        def _ready(d) -> bool:
+            # 준비되면 같은 호출에서 이미지까지 추출해 두어 api_get_captcha 왕복을 생략
+            snapshot = d.execute_script(_JS_CAPTCHA_SNAPSHOT, previous_loads)
+            if snapshot is None:
+                return False
+            self._captcha_data_url = snapshot
+            return True
+        
+        try:
+            WebDriverWait(
+                self.driver, timeout, poll_frequency=0.05,
+                ignored_exceptions=(UnexpectedAlertPresentException,)
+            ).until(_ready)
+            return True
+        except TimeoutException:
+            return False
+    
+    def _wait_court_click_outcome(
+        self, timeout: float = 2.0, previous_loads: Optional[int] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        코트 클릭 후 (후킹된) alert 또는 캡차 표시 중 먼저 오는 쪽까지 대기합니다.
+        previous_loads(클릭 전 캡차 로드 횟수) 이후 새로 로드되지 않은 이미지는 이전 캡차이므로 무시합니다.
+        
+        Returns:
+            Tuple of (시간 내 결과 확인 여부, alert 메시지 또는 None)
+        """
+        outcome: Dict[str, str] = {}
+        
+        def _ready(d) -> bool:
+            result = d.execute_script(_JS_ALERT_OR_CAPTCHA, previous_loads)
+            if result is None:
+                return False
+            if isinstance(result, dict):
+                outcome['alert'] = result.get('alert', '')
+            else:
+                self._captcha_data_url = result
+            return True
+        
+        try:
+            WebDriverWait(
+                self.driver, timeout, poll_frequency=0.05,
+                ignored_exceptions=(UnexpectedAlertPresentException,)
+            ).until(_ready)
+            return True, outcome.get('alert')
+        except TimeoutException:
+            return False, None
+    
     # =========================================================================
     # 메인 실행 로직
     # =========================================================================
@@ -1077,6 +1614,9 @@ class HybridReservationBot:
         strategies = self.config.reservation.strategies
         
         try:
+            # OCR 엔진 사전 로딩 (로그인·페이지 진입의 네트워크 대기와 병렬)
+            self._preload_future = self._ocr_pool.submit(self.captcha_solver.preload)
+            
             # ====== PHASE 1: Selenium으로 로그인 및 WebGate 통과 ======
             self.logger.info("\n📌 PHASE 1: Selenium 로그인")
             
@@ -1085,9 +1625,6 @@ class HybridReservationBot:
                 self.notifier.send_failure("로그인 실패", result)
                 return 1
             
-            # OCR 엔진 사전 로딩 (로그인 직후)
-            self.captcha_solver.preload()
-            
             # ====== PHASE 2: 예약 페이지 진입 (9시 이전 진입) ======
             self.logger.info("\n📌 PHASE 2: 예약 페이지 진입 (9시 이전 진입)")
             if not self.navigate_to_reservation_page():
@@ -1102,8 +1639,20 @@ class HybridReservationBot:
                 self.measure_server_time_offset()
             else:
                 self.logger.info("⏩ --target-time 지정됨, 서버 오프셋 측정 생략")
+            # 로그인 쿠키를 미리 세션에 복사 + 커넥션 예열 (9시 직후 캘린더 API 선호출용)
+            self.extract_cookies_to_session()
+            self.warm_up_connection()
             self.wait_for_reservation_open()
             
+            # 캘린더 API는 WebGate 화면과 무관하게 세션 쿠키로 호출 가능하므로
+            # 대기열 통과를 기다리는 동안 백그라운드에서 먼저 호출
+            # (driver는 메인 스레드에서만 사용, 백그라운드는 requests 세션만 사용)
+            start_time = time.time()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                calendar_future = executor.submit(self.api_get_calendar)
+                self.wait_for_webgate()
+                calendar_data = calendar_future.result()
+            
             # ====== PHASE 4: 쿠키 추출 ======
             self.logger.info("\n📌 PHASE 4: 쿠키 추출")
             
@@ -1116,8 +1665,11 @@ class HybridReservationBot:
             self.logger.info("\n📌 PHASE 5: HTTP API 예약 시작")
             
             # 5.1 캘린더 API로 날짜 및 xDay 획득
-            start_time = time.time()
-            calendar_data = self.api_get_calendar()
+            # 선호출이 실패한 경우(세션 만료, WebGate 미통과 등)에만 갱신된 쿠키로 재조회
+            if not calendar_data or not calendar_data.get('calendar_list'):
+                self.logger.info("ℹ️ 캘린더 선호출 실패, WebGate 통과 쿠키로 재조회")
+                start_time = time.time()
+                calendar_data = self.api_get_calendar()
             
             if not calendar_data or not calendar_data.get('calendar_list'):
                 result.error_message = "캘린더 조회 실패"
@@ -1126,14 +1678,11 @@ class HybridReservationBot:
             
             # 가장 마지막 날짜 선택
             calendar_list = calendar_data['calendar_list']
-            latest_date_info = None
-            
-            for date_info in reversed(calendar_list):
-                if date_info.get('checkDay') == 'Y':
-                    latest_date_info = date_info
-                    break
+            latest_date_info = next(
+                (d for d in reversed(calendar_list) if d.get('checkDay') == 'Y'), None
+            )
             
-            if not latest_date_info:
+            if latest_date_info is None:
                 result.error_message = "예약 가능한 날짜 없음"
                 self.notifier.send_failure("예약 가능한 날짜 없음", result)
                 return 1
@@ -1150,8 +1699,17 @@ class HybridReservationBot:
             result.date = target_date
             
             # 5.2 Selenium으로 날짜 선택 (시간 슬롯 표시를 위해)
+            # 첫 전략용 시간 목록 API는 Selenium 날짜 선택과 독립적이므로 동시에 조회
+            # (driver는 메인 스레드에서만 사용, 백그라운드는 requests 세션만 사용)
             self.logger.info("\n📌 PHASE 5.5: Selenium 날짜 선택")
-            if not self.select_date_with_selenium(target_date_normalized):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                time_future = executor.submit(
+                    self.api_get_time_list, target_date_normalized, target_xdate
+                )
+                date_selected = self.select_date_with_selenium(target_date_normalized)
+                prefetched_time_data = time_future.result()
+            
+            if not date_selected:
                 result.error_message = "Selenium 날짜 선택 실패"
                 self.notifier.send_failure("Selenium 날짜 선택 실패", result)
                 return 1
@@ -1160,80 +1718,26 @@ class HybridReservationBot:
             for strategy in strategies:
                 self.logger.info(f"\n🎯 전략 시도: {strategy.name}")
                 
-                # 시간 목록 조회
-                time_data = self.api_get_time_list(target_date_normalized, target_xdate)
+                # 시간 목록 조회 (첫 전략은 미리 받아둔 결과 사용, 이후는 최신 상태 재조회)
+                if prefetched_time_data is not None:
+                    time_data, prefetched_time_data = prefetched_time_data, None
+                else:
+                    time_data = self.api_get_time_list(target_date_normalized, target_xdate)
                 
                 if not time_data or not time_data.get('time_list'):
                     self.logger.info(f"⚠️ 시간 조회 실패, 다음 전략...")
                     continue
                 
-                # 가능한 슬롯 찾기
-                time_list = time_data['time_list']
-                
-                # 가용 시간대 찾기 
-                available_time_slots = []
-                
-                # target_hour가 지정된 경우: 해당 시간대만 확인
-                # auto_find_latest=True인 경우: 가장 늦은 시간부터 역순으로 탐색
-                if strategy.auto_find_latest:
-                    # 3순위: 가장 늦은 시간부터 역순 탐색
-                    self.logger.info(f"   └ 가장 늦은 연속 시간대 탐색 모드")
-                    search_range = range(len(time_list) - strategy.time_slot_count, -1, -1)
-                else:
-                    # 1, 2순위: 특정 target_hour부터 시작
-                    self.logger.info(f"   └ 특정 시간대({strategy.target_hour}시) 탐색 모드")
-                    search_range = range(len(time_list) - strategy.time_slot_count + 1)
-                
-                for i in search_range:
-                    slots = time_list[i:i + strategy.time_slot_count]
-                    
-                    # 첫 슬롯의 시작 시간 확인
-                    first_slot_start = slots[0].get('startT', '')
-                    if first_slot_start:
-                        slot_start_hour = int(first_slot_start.split(':')[0])
-                        
-                        # target_hour가 지정된 경우, 해당 시간이 아니면 스킵
-                        if not strategy.auto_find_latest and slot_start_hour != strategy.target_hour:
-                            continue
-                    
-                    # 모든 슬롯의 가용 수량 확인
-                    all_available = True
-                    for slot in slots:
-                        tot = int(slot.get('totCnt', 0))
-                        end = int(slot.get('endCnt', 0))
-                        prog = int(slot.get('progCnt', 0))
-                        others = int(slot.get('othersCnt', 0))
-                        avail = tot - end - prog - others
-                        if avail <= 0:
-                            all_available = False
-                            break
-                    
-                    if all_available:
-                        start_times = [slot.get('startT', '') for slot in slots]
-                        end_times = [slot.get('endT', '') for slot in slots]
-                        if all(start_times) and all(end_times):
-                            available_time_slots.append({
-                                'start_times': start_times,
-                                'end_times': end_times
-                            })
-                            
-                            # target_hour가 지정된 경우 정확히 하나만 찾으면 됨
-                            if not strategy.auto_find_latest:
-                                break
-                
-                if not available_time_slots:
-                    self.logger.info(f"⚠️ 연속 {strategy.time_slot_count}시간 가용 시간대 없음, 다음 전략...")
-                    continue
-                
-                self.logger.info(f"✅ 연속 {strategy.time_slot_count}시간 가용 시간대: {len(available_time_slots)}개 발견")
-                for ts in available_time_slots[:3]:
-                    self.logger.info(f"   └ {ts['start_times'][0]}~{ts['end_times'][-1]}")
-                
-                # 각 시간대마다 시도
-                for time_slot in available_time_slots:
+                # 가능한 슬롯 찾기 (후보를 시도 직전에 하나씩 생성 → 앞 후보에서 성공하면 나머지는 만들지 않음)
+                found_candidate = False
+                for time_slot in self._iter_time_slot_candidates(time_data['time_list'], strategy):
                     start_times = time_slot['start_times']
                     end_times = time_slot['end_times']
-                    start_hour = int(start_times[0].split(':')[0])
+                    start_hour = time_slot['start_hour']
+                    found_candidate = True
+                    self.logger.info(
+                        f"✅ 연속 {strategy.time_slot_count}시간 가용 시간대 후보: {start_times[0]}~{end_times[-1]}"
+                    )
                     
                     # 1. Selenium으로 시간 선택 + 가용 코트 확인
                     success, available_courts = self.select_time_with_selenium(
@@ -1274,7 +1778,7 @@ class HybridReservationBot:
                             result.court_number = court_no
                             result.time_slot = f"{start_times[0]}~{end_times[-1]}"
                             result.strategy_name = strategy.name
-                            result.court_type = "실내 코트" if court_no in INDOOR_COURTS else "야외 코트"
+                            result.court_type = "실내 코트" if court_no in INDOOR_COURTS_SET else "야외 코트"
                             
                             self.logger.info("=" * 60)
                             self.logger.info("🎉 예약 성공!")
@@ -1289,6 +1793,9 @@ class HybridReservationBot:
                         
                         # 실패 시 다음 코트 시도
                         self.logger.info(f"⚠️ {message}, 다음 코트 시도...")
+                
+                if not found_candidate:
+                    self.logger.info(f"⚠️ 연속 {strategy.time_slot_count}시간 가용 시간대 없음, 다음 전략...")
             
             # 모든 전략 실패 — 자리 없음은 프로그램 에러가 아니므로 exit 0
             result.error_message = "모든 전략 실패 (빈 자리 없음)"
@@ -1307,4 +1814,7 @@ class HybridReservationBot:
 def run_hybrid_bot(driver: webdriver.Chrome, config: Config, logger: Logger, notifier: SlackNotifier) -> int:
     """하이브리드 봇 실행 헬퍼 함수."""
     bot = HybridReservationBot(driver, config, logger, notifier)
-    return bot.run()
+    try:
+        return bot.run()
+    finally:
+        bot.flush_notifications()
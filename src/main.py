@@ -29,6 +29,8 @@ def main() -> int:
     """
     logger = Logger()
     driver = None
+    notifier = None
+    bot = None
     
     try:
         logger.info("🚀 테니스 예약 봇 시작")
@@ -80,6 +82,10 @@ def main() -> int:
         return 1
         
     finally:
+        # OCR 워커 정리
+        if bot:
+            bot.captcha_solver.close()
+        
         # Close browser
         if driver:
             try:
@@ -87,6 +93,10 @@ def main() -> int:
                 logger.info("🔚 브라우저 종료")
             except Exception:
                 pass
+        
+        # 큐에 남은 Slack 알림 전송 대기
+        if notifier:
+            notifier.flush()
 
 
 if __name__ == "__main__":
@@ -13,6 +13,7 @@ Options:
 """
 import sys
 import argparse
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -49,13 +50,20 @@ def parse_target_time_kst(time_str: str) -> Optional[datetime]:
 
 def apply_preferred_hour(config, hour: int, logger: Logger, reason: str) -> None:
     """auto_find_latest=False 전략들의 target_hour와 name을 일괄 덮어씁니다."""
+    strategies = []
     for strategy in config.reservation.strategies:
         if not strategy.auto_find_latest:
-            strategy.target_hour = hour
             end_hour = hour + strategy.time_slot_count
             # 전략 이름도 실제 시간대에 맞게 갱신
             court_label = strategy.name.split()[0]  # "실내" or "야외" 등
-            strategy.name = f"{court_label} 코트 {hour}-{end_hour}시"
+            strategy = replace(
+                strategy,
+                target_hour=hour,
+                name=f"{court_label} 코트 {hour}-{end_hour}시",
+            )
+        strategies.append(strategy)
+    # 전략은 불변 객체이므로 새 튜플로 교체 (모듈 상수는 그대로 유지)
+    config.reservation.strategies = tuple(strategies)
     logger.info(f"🕒 선호 시간대 적용({reason}): {hour}시 시작")
 
 
@@ -134,6 +142,7 @@ def main():
     
     # 브라우저 드라이버 생성
     driver = None
+    bot = None
     try:
         driver = create_driver(config)  # Config 기반으로 GUI/Headless 자동 결정
         
@@ -155,6 +164,9 @@ def main():
         if driver:
             logger.info("🔒 브라우저 종료")
             driver.quit()
+        # 브라우저 종료와 겹쳐 전송된 Slack 알림 완료 대기
+        if bot:
+            bot.flush_notifications()
 
 
 if __name__ == "__main__":
@@ -1,16 +1,33 @@
 """
 Slack notification and logging module for Court Scheduler.
 """
+import os
+import queue
 import sys
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
-from typing import Optional, List
+from functools import lru_cache
+from datetime import timezone, timedelta
+from typing import Deque, Optional, List
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import Config
 
 
+@lru_cache(maxsize=8)
+def _court_type_emoji(court_type: str) -> str:
+    """코트 타입 문자열별 이모지 (court_type은 "실내 코트"/"야외 코트" 두 종류뿐이라 캐시)"""
+    if "실내" in court_type:
+        return "🏠"
+    return "🌳"
+
+
 @dataclass
 class ReservationResult:
     """예약 결과 정보를 담는 데이터 클래스"""
@@ -26,9 +43,7 @@ class ReservationResult:
     
     def get_court_type_emoji(self) -> str:
         """코트 타입에 따른 이모지 반환"""
-        if "실내" in self.court_type:
-            return "🏠"
-        return "🌳"
+        return _court_type_emoji(self.court_type)
     
     def format_success_message(self) -> str:
         """성공 메시지 포맷팅"""
@@ -60,29 +75,139 @@ class ReservationResult:
 
 # 한국 시간대
 KST = timezone(timedelta(hours=9))
+_KST_OFFSET_NS = 9 * 3600 * 1_000_000_000
+
+# Slack 첨부 고정 필드 (호출마다 text/ts 등만 채움)
+_SUCCESS_ATTACH_TMPL = {"title": "🎉 Reservation Success", "color": "#2EB67D", "footer": "Court Scheduler"}
+_FAILURE_ATTACH_TMPL = {
+    "title": "❌ Reservation Failed",
+    "title_link": "https://github.com/actions",
+    "color": "#E01E5A",
+    "footer": "Court Scheduler",
+}
+_SUCCESS_LOG_TMPL = {"title": "📋 실행 로그", "color": "#36a64f"}
+_FAILURE_LOG_TMPL = {"title": "📋 실행 로그 (최근)", "color": "#E01E5A"}
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class Logger:
     """Logger with buffer for Slack notifications."""
     
-    def __init__(self):
-        self.buffer: list[str] = []
+    # 버퍼에 보관할 최대 로그 줄 수 (오래된 줄부터 버림)
+    MAX_LINES = 2000
+    
+    # stdout flush 기준 (줄 수 또는 경과 시간)
+    # 다음 로그 없이 긴 대기에 들어가도 백그라운드 타이머가 FLUSH_INTERVAL 안에 flush
+    FLUSH_LINES = 32
+    FLUSH_INTERVAL = 0.5
+    
+    def __init__(self, debug: Optional[bool] = None):
+        # 상세(debug) 로그 출력 여부: 지정하지 않으면 COURT_DEBUG 환경변수로 결정
+        self.debug_enabled = bool(os.environ.get("COURT_DEBUG")) if debug is None else debug
+        self._lines: Deque[str] = deque(maxlen=self.MAX_LINES)
+        self._char_count = 0
+        # 초 단위 타임스탬프 접두사 캐시 (같은 초 안에서는 strftime/gmtime 생략)
+        self._ts_sec = -1
+        self._ts_prefix = ""
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._flush_pending = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        # 캘린더 선조회/Slack/OCR 워커 스레드도 로그를 남기므로 상태 갱신은 락 안에서
+        # (타임스탬프 캐시 쌍, 버퍼와 글자 수, flush 카운터)
+        self._lock = threading.Lock()
+    
+    def flush(self, now: Optional[float] = None) -> None:
+        """Flush pending stdout writes."""
+        with self._lock:
+            self._flush_locked(now)
+    
+    def _flush_locked(self, now: Optional[float] = None) -> None:
+        """flush() body; caller holds self._lock."""
+        sys.stdout.flush()
+        self._unflushed = 0
+        self._last_flush = time.monotonic() if now is None else now
+    
+    def _schedule_flush(self) -> None:
+        """Arm the background flusher (started lazily on first use)."""
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, name="log-flush", daemon=True)
+            self._flusher.start()
+        self._flush_pending.set()
+    
+    def _flush_loop(self) -> None:
+        """Flush buffered lines FLUSH_INTERVAL after the first unflushed write."""
+        while True:
+            self._flush_pending.wait()
+            time.sleep(self.FLUSH_INTERVAL)
+            self._flush_pending.clear()
+            with self._lock:
+                if self._unflushed:
+                    self._flush_locked()
+    
+    def _timestamp(self) -> str:
+        """KST 'YYYY-MM-DD HH:MM:SS.mmm' timestamp without datetime/strftime (caller holds self._lock)."""
+        sec, rem = divmod(time.time_ns() + _KST_OFFSET_NS, 1_000_000_000)
+        if sec != self._ts_sec:
+            lt = time.gmtime(sec)
+            self._ts_prefix = (
+                f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} "
+                f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}."
+            )
+            self._ts_sec = sec
+        return f"{self._ts_prefix}{rem // 1_000_000:03d}"
     
     def info(self, msg: str) -> None:
         """Log info message with timestamp."""
-        timestamp = datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        log_str = f"\t[INFO]>> [{timestamp}] : {msg}\n"
-        sys.stdout.write(log_str)
-        sys.stdout.flush()
-        self.buffer.append(log_str)
+        with self._lock:
+            log_str = f"\t[INFO]>> [{self._timestamp()}] : {msg}\n"
+            sys.stdout.write(log_str)
+            self._unflushed += 1
+            now = time.monotonic()
+            if self._unflushed >= self.FLUSH_LINES or now - self._last_flush >= self.FLUSH_INTERVAL:
+                self._flush_locked(now)
+            elif self._unflushed == 1:
+                self._schedule_flush()
+            if len(self._lines) == self.MAX_LINES:
+                self._char_count -= len(self._lines[0])
+            self._lines.append(log_str)
+            self._char_count += len(log_str)
+    
+    def debug(self, msg: str, *args) -> None:
+        """Log a detail message; formatting with args is skipped unless debug is enabled."""
+        if not self.debug_enabled:
+            return
+        self.info(msg % args if args else msg)
+    
+    @property
+    def buffer_size(self) -> int:
+        """Total characters currently buffered."""
+        return self._char_count
     
     def get_buffer(self) -> str:
         """Get all buffered logs as string."""
-        return ''.join(self.buffer)
+        with self._lock:
+            return ''.join(self._lines)
+    
+    def get_tail(self, n_chars: int) -> str:
+        """Get the last n_chars of buffered logs without joining the whole buffer."""
+        with self._lock:
+            if self._char_count <= n_chars:
+                return ''.join(self._lines)
+            tail: List[str] = []
+            total = 0
+            for line in reversed(self._lines):
+                tail.append(line)
+                total += len(line)
+                if total >= n_chars:
+                    break
+        return ''.join(reversed(tail))[-n_chars:]
     
     def clear_buffer(self) -> None:
         """Clear the log buffer."""
-        self.buffer = []
+        with self._lock:
+            self._lines.clear()
+            self._char_count = 0
 
 
 class SlackNotifier:
@@ -94,6 +219,77 @@ class SlackNotifier:
         self.enabled = bool(self.webhook_url)
         self.logger = logger
         self.login_id = login_id or getattr(config, "login_id", "")
+        self._confirm_link = f"\n\n<{self.base_url}|🔗 예약 확인하기>"
+        
+        # 웹훅 전송용 keep-alive 세션 (알림마다 TCP/TLS 핸드셰이크 반복 방지)
+        # POST는 멱등이 아니므로 요청이 서버에 닿기 전인 연결 실패만 재시도
+        # (읽기 오류/5xx 재시도는 같은 메시지 중복 게시 위험, 429는 _send_message에서 Retry-After 준수 후 1회 재시도)
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=0,
+                status=0,
+                other=0,
+                backoff_factor=0.5,
+                allowed_methods=["POST"],
+            ),
+        ))
+    
+        # 전송 간격 제한 (429/5xx 시 간격 2배, 정상 응답 시 조금씩 감소)
+        self._min_interval = 0.0
+        self._next_allowed_ts = 0.0
+        
+        # 전송 큐 + 워커 스레드 (send_*는 큐에 넣고 바로 반환), webhook이 없으면 워커를 띄우지 않음
+        self._q: "queue.Queue[dict]" = queue.Queue(maxsize=64)
+        self._worker: Optional[threading.Thread] = None
+        if self.enabled:
+            self._worker = threading.Thread(target=self._drain, name="slack-notifier", daemon=True)
+            self._worker.start()
+    
+    def _drain(self) -> None:
+        """Worker loop: post queued payloads one by one."""
+        while True:
+            data = self._q.get()
+            try:
+                self._send_message(data)
+            except Exception as e:
+                self.logger.info(f"Slack 메시지 전송 실패: {e}")
+            finally:
+                self._q.task_done()
+    
+    def _enqueue(self, data: dict) -> bool:
+        """Queue a payload for the worker; send synchronously if the queue is full (or no worker)."""
+        if self._worker is None:
+            return self._send_message(data)
+        try:
+            self._q.put_nowait(data)
+            return True
+        except queue.Full:
+            return self._send_message(data)
+    
+    def flush(self, timeout: float = 15.0) -> bool:
+        """
+        Wait until queued notifications are sent.
+        
+        Returns:
+            True if the queue drained within timeout, False otherwise
+        """
+        deadline = time.monotonic() + timeout
+        with self._q.all_tasks_done:
+            while self._q.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._q.all_tasks_done.wait(remaining)
+        return True
+    
+    def close(self) -> None:
+        """Close the webhook session."""
+        self._session.close()
     
     def _send_message(self, data: dict) -> bool:
         """
@@ -106,12 +302,14 @@ class SlackNotifier:
             self.logger.info("Slack webhook not configured, skipping notification")
             return False
         
+        # 한 번만 직렬화해 429 재시도에도 같은 body 재사용
+        body = orjson.dumps(data)
         try:
-            response = requests.post(
-                self.webhook_url,
-                json=data,
-                timeout=10,
-            )
+            response = self._post(body)
+            if response.status_code == 429:
+                # Retry-After 만큼 기다린 뒤 한 번만 재시도
+                self.logger.info("Slack rate limit (429), 재시도 대기")
+                response = self._post(body)
             if response.status_code == 200:
                 self.logger.info("Slack 메시지 전송 성공")
                 return True
@@ -122,9 +320,47 @@ class SlackNotifier:
             self.logger.info(f"Slack 메시지 전송 실패: {e}")
             return False
     
+    def _post(self, body: bytes) -> requests.Response:
+        """Post to the webhook, honoring the current rate-limit window."""
+        delay = self._next_allowed_ts - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        response = self._session.post(
+            self.webhook_url,
+            data=body,
+            headers=_JSON_HEADERS,
+            timeout=(3.05, 10),
+        )
+        self._update_rate_limit(response)
+        return response
+    
+    def _update_rate_limit(self, response: requests.Response) -> None:
+        """Adjust send spacing from the response status and rate-limit headers."""
+        status = response.status_code
+        if status == 429 or status >= 500:
+            self._min_interval = min(max(self._min_interval * 2, 0.5), 30.0)
+        else:
+            self._min_interval = max(self._min_interval - 0.1, 0.0)
+        
+        now = time.monotonic()
+        wait_s = self._min_interval
+        headers = response.headers
+        try:
+            if "Retry-After" in headers:
+                wait_s = max(wait_s, float(headers["Retry-After"]))
+            elif headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+                wait_s = max(wait_s, float(headers["X-RateLimit-Reset"]) - time.time())
+        except ValueError:
+            pass
+        self._next_allowed_ts = now + min(wait_s, 60.0)
+    
     def send_success(self, message: str, result: Optional[ReservationResult] = None) -> bool:
         """Send success notification with reservation details."""
-        buffer_str = self.logger.get_buffer()
+        if not self.enabled:
+            self.logger.info("Slack webhook not configured, skipping notification")
+            return False
+        
+        self.logger.flush()
         
         # 상세 정보가 있으면 포맷팅된 메시지 사용
         if result:
@@ -135,32 +371,27 @@ class SlackNotifier:
         data = {
             "attachments": [
                 {
-                    "title": "🎉 Reservation Success",
+                    **_SUCCESS_ATTACH_TMPL,
                     "title_link": self.base_url,
-                    "text": (
-                        f"{detail_text}\n\n"
-                        f"<{self.base_url}|🔗 예약 확인하기>"
-                    ),
-                    "color": "#2EB67D",
-                    "footer": "Court Scheduler",
-                    "ts": int(datetime.now(KST).timestamp())
+                    "text": detail_text + self._confirm_link,
+                    "ts": int(time.time()),
                 }
             ]
         }
         
         # 로그는 별도 첨부파일로 (너무 길면 생략)
-        if len(buffer_str) < 3000:
-            data["attachments"].append({
-                "title": "📋 실행 로그",
-                "text": f"```{buffer_str}```",
-                "color": "#36a64f"
-            })
+        if self.logger.buffer_size < 3000:
+            data["attachments"].append({**_SUCCESS_LOG_TMPL, "text": f"```{self.logger.get_buffer()}```"})
         
-        return self._send_message(data)
+        return self._enqueue(data)
     
     def send_failure(self, message: str, result: Optional[ReservationResult] = None) -> bool:
         """Send failure notification with details."""
-        buffer_str = self.logger.get_buffer()
+        if not self.enabled:
+            self.logger.info("Slack webhook not configured, skipping notification")
+            return False
+        
+        self.logger.flush()
         
         # 상세 정보가 있으면 포맷팅된 메시지 사용
         if result:
@@ -170,24 +401,13 @@ class SlackNotifier:
         
         data = {
             "attachments": [
-                {
-                    "title": "❌ Reservation Failed",
-                    "title_link": "https://github.com/actions",
-                    "text": detail_text,
-                    "color": "#E01E5A",
-                    "footer": "Court Scheduler",
-                    "ts": int(datetime.now(KST).timestamp())
-                }
+                {**_FAILURE_ATTACH_TMPL, "text": detail_text, "ts": int(time.time())}
             ]
         }
         
         # 로그 첨부 (길이 제한)
-        log_text = buffer_str[-2500:] if len(buffer_str) > 2500 else buffer_str
+        log_text = self.logger.get_tail(2500)
         if log_text:
-            data["attachments"].append({
-                "title": "📋 실행 로그 (최근)",
-                "text": f"```{log_text}```",
-                "color": "#E01E5A"
-            })
+            data["attachments"].append({**_FAILURE_LOG_TMPL, "text": f"```{log_text}```"})
         
-        return self._send_message(data)
+        return self._enqueue(data)
@@ -2,9 +2,15 @@
 Tennis court scheduler logic for Tennis Court.
 Based on actual site structure analysis.
 """
+import base64
+import hashlib
 import io
 import re
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime, timezone, timedelta
 from email.utils import parsedate_to_datetime
 from typing import List, Optional, Tuple
@@ -21,21 +27,187 @@ from selenium.common.exceptions import (
     NoAlertPresentException,
 )
 
-from .config import Config, INDOOR_COURTS
+from .config import Config, INDOOR_COURTS_SET
 from .notifier import Logger, SlackNotifier, ReservationResult
 
 
 # 한국 시간대
 KST = timezone(timedelta(hours=9))
 
+# pytesseract 입력 이진화용 point() 테이블 (128 미만 검정, 이상 흰색)
+_BW_THRESHOLD_TABLE = [0] * 128 + [255] * 128
+
+# 자주 쓰는 요소 로케이터 (호출마다 튜플/문자열을 만들지 않도록 모듈 상수로 고정, XPath 대신 CSS)
+_SEL_LOGIN_ID = (By.NAME, 'login_id')
+_SEL_LOGIN_PWD = (By.NAME, 'login_pwd')
+_SEL_LOGIN_BUTTON = (By.CSS_SELECTOR, '#content > div > div > div > button')
+_SEL_DATES = (By.CSS_SELECTOR, "tbody a[href^='javascript:fn_tennis_time_list']")
+_SEL_TIME_SLOTS = (By.CSS_SELECTOR, 'ul#time_con li')
+_SEL_CAPTCHA_IMG = (By.CSS_SELECTOR, '#layer_captcha_wrap > div > img')
+
+# OCR 결과에서 숫자만 남기기: ASCII는 translate 테이블로 제거, 비ASCII(한자 등)가 남으면 정규식으로 정리
+_NON_DIGIT_DELETE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not 48 <= c <= 57))
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+
+# 날짜 링크 href ("fn_tennis_time_list('2025', '01', '06')") / 시간 슬롯 label의 "1월 5일"
+_DATE_HREF_RE = re.compile(r"fn_tennis_time_list\('(\d+)',\s*'(\d+)',\s*'(\d+)'\)")
+_SLOT_DATE_RE = re.compile(r'(\d+월\s*\d+일)')
+
+
+def _digits_only(text: str) -> str:
+    """Keep only ASCII digits 0-9."""
+    text = text.translate(_NON_DIGIT_DELETE)
+    return text if text.isascii() else _NON_DIGIT_RE.sub('', text)
+
+
+def _find_latest_window(time_slots: List[dict], count: int, exclude_hours: set, base_hour: int = 6) -> Optional[int]:
+    """
+    Return the start index of the latest run of `count` bookable slots, or None.
+    time_slots는 _wait_time_slot_states() 결과({'enabled', 'status', ...}), index 0 = base_hour시.
+    """
+    total_slots = len(time_slots)
+    # 각 슬롯부터 이어지는 예약 가능 슬롯 수를 뒤에서부터 한 번에 계산
+    # (구간마다 count개 슬롯을 다시 검사하지 않고 run_length[start] >= count로 판별)
+    run_length = [0] * (total_slots + 1)
+    for idx in range(total_slots - 1, -1, -1):
+        slot = time_slots[idx]
+        if slot['enabled'] and "신청가능" in slot['status']:
+            run_length[idx] = run_length[idx + 1] + 1
+    
+    # 뒤에서부터 탐색 (가장 늦은 시간부터), 이미 시도한 시작 시간은 건너뛰기
+    for start_index in range(total_slots - count, -1, -1):
+        if base_hour + start_index in exclude_hours:
+            continue
+        if run_length[start_index] >= count:
+            return start_index
+    return None
+
+
+def _common_courts(preferred_courts: List[int], available_per_hour: List[List[int]]) -> List[int]:
+    """Courts available in every hour of the window, in preferred_courts order."""
+    common = set(preferred_courts)
+    for available in available_per_hour:
+        common.intersection_update(available)
+    return [c for c in preferred_courts if c in common]
+
+
+# 주어진 코트 번호 중 예약 가능 이미지(btn_tennis_noreserve 아님)인 코트만 반환
+_JS_AVAILABLE_COURTS = """
+const out = [];
+for (const n of arguments[0]) {
+    const el = document.getElementById('tennis_court_img_a_1_' + n);
+    const img = el && el.querySelector('img');
+    if (img && !(img.getAttribute('src') || '').includes('btn_tennis_noreserve')) out.push(n);
+}
+return out;
+"""
+
+# 주어진 코트 번호 중 첫 번째 예약 가능 코트를 찾아 클릭하고 {court, alerts} 반환 (없으면 court=null)
+# 클릭 중 뜨는 alert는 window.alert를 잠시 가로채 기록 (네이티브 alert가 스크립트 반환값을 막지 않도록)
+_JS_CLICK_FIRST_AVAILABLE_COURT = """
+const alerts = [];
+for (const n of arguments[0]) {
+    const el = document.getElementById('tennis_court_img_a_1_' + n);
+    const img = el && el.querySelector('img');
+    if (img && !(img.getAttribute('src') || '').includes('btn_tennis_noreserve')) {
+        const originalAlert = window.alert;
+        window.alert = msg => { alerts.push(String(msg)); };
+        try {
+            el.click();
+        } finally {
+            window.alert = originalAlert;
+        }
+        return {court: n, alerts: alerts};
+    }
+}
+return {court: null, alerts: alerts};
+"""
+
+# 캡차 <img> 로드 완료 여부
+_JS_IMG_LOADED = "return arguments[0].complete && arguments[0].naturalWidth > 0;"
+
+# 로드된 <img>를 원본 해상도 PNG data URL로 변환 (실패 시 null)
+_JS_IMG_TO_DATA_URL = """
+const img = arguments[0];
+try {
+    const canvas = document.createElement('canvas');
+    canvas.width = img.naturalWidth;
+    canvas.height = img.naturalHeight;
+    canvas.getContext('2d').drawImage(img, 0, 0);
+    return canvas.toDataURL('image/png');
+} catch (e) {
+    return null;
+}
+"""
+
+# 문서 로딩 완료 + 진행 중인 jQuery AJAX 없음 (jQuery가 없으면 로딩 완료만 확인)
+_JS_PAGE_IDLE = "return document.readyState === 'complete' && (!window.jQuery || window.jQuery.active === 0);"
+
+# 시간 슬롯 상태를 한 번에 수집: [{enabled, checked, status(span.label), label(label 텍스트)}]
+_JS_TIME_SLOT_STATES = """
+return Array.from(document.querySelectorAll('ul#time_con li'), li => {
+    const box = li.querySelector('input[type="checkbox"]');
+    const status = li.querySelector('span.label');
+    const label = li.querySelector('label');
+    return {
+        enabled: !!box && !box.disabled,
+        checked: !!box && box.checked,
+        status: status ? status.innerText : '',
+        label: label ? label.innerText : '',
+    };
+});
+"""
+
+# 주어진 인덱스의 시간 슬롯 체크박스를 순서대로 클릭하고, 그동안 뜬 alert 메시지를 반환
+# (클릭 중 alert가 스크립트를 멈추지 않도록 window.alert를 잠시 기록용으로 교체)
+# arguments[0]이 null이면 현재 체크된 슬롯 전체를 해제
+_JS_TOGGLE_TIME_INDICES = """
+const items = document.querySelectorAll('ul#time_con li');
+const alerts = [];
+const originalAlert = window.alert;
+window.alert = msg => { alerts.push(String(msg)); };
+let indices = arguments[0];
+if (indices === null) {
+    indices = [];
+    items.forEach((li, i) => {
+        const box = li.querySelector('input[type="checkbox"]');
+        if (box && box.checked) indices.push(i);
+    });
+}
+try {
+    for (const i of indices) {
+        const box = items[i] && items[i].querySelector('input[type="checkbox"]');
+        if (box) box.click();
+    }
+} finally {
+    window.alert = originalAlert;
+}
+return {clicked: indices.length, alerts: alerts};
+"""
+
 
 class CaptchaSolver:
     """CAPTCHA solver using multiple OCR engines."""
     
+    # 인식 결과 캐시 최대 항목 수
+    CACHE_SIZE = 256
+    
+    # ddddocr 실패 후 EasyOCR도 실패했을 때 pytesseract 결과를 기다리는 최대 시간 (초)
+    TESSERACT_WAIT = 4.0
+    
     def __init__(self, logger: Logger):
         self.logger = logger
         self._ddddocr = None  # Lazy initialization
         self._easyocr_reader = None
+        # EasyOCR 백그라운드 로딩 상태 (preload에서 시작, 최초 fallback 시 합류)
+        self._easyocr_ready = threading.Event()
+        self._easyocr_lock = threading.Lock()
+        self._easyocr_loading = False
+        # 캡차 PNG 해시 → 인식 결과 LRU (같은 이미지 재출제 시 OCR 생략)
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._last_key: Optional[bytes] = None
+        # ddddocr 실패 시 EasyOCR과 병렬로 pytesseract를 돌리는 워커
+        self._vote_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr-vote")
     
     def preload(self) -> None:
         """
@@ -48,14 +220,39 @@ class CaptchaSolver:
         try:
             import ddddocr
             self._ddddocr = ddddocr.DdddOcr(show_ad=False)
+            # 첫 추론 시의 ONNX Runtime 세션/스레드풀 초기화를 미리 치러둠
+            dummy = io.BytesIO()
+            Image.new('RGB', (100, 40), (255, 255, 255)).save(dummy, format='PNG', compress_level=0)
+            self._ddddocr.classification(dummy.getvalue())
             self.logger.info("✅ ddddocr 사전 로딩 완료")
         except Exception as e:
             self.logger.info(f"⚠️ ddddocr 사전 로딩 실패: {e}")
         
-        # easyocr는 사전 로딩하지 않음 (15초 소요)
-        # ddddocr 실패 시에만 lazy loading
+        # easyocr는 초기화가 15초가량 걸리므로 백그라운드 스레드에서 로딩
+        self._easyocr_loading = True
+        threading.Thread(target=self._load_easyocr_bg, name="easyocr-preload", daemon=True).start()
         
-        self.logger.info("✅ OCR 엔진 사전 로딩 완료")
+        self.logger.info("✅ OCR 엔진 사전 로딩 완료 (EasyOCR는 백그라운드 로딩 중)")
+    
+    def _load_easyocr_bg(self) -> None:
+        """Background target: build the EasyOCR reader ahead of the first fallback."""
+        try:
+            self._ensure_easyocr_reader()
+            # 더미 이미지로 한 번 추론해 첫 호출 지연을 백그라운드에서 소진
+            import numpy as np
+            self._easyocr_reader.readtext(np.zeros((40, 100, 3), dtype=np.uint8), allowlist='0123456789')
+            self.logger.info("✅ EasyOCR 백그라운드 로딩 완료")
+        except Exception as e:
+            self.logger.info(f"⚠️ EasyOCR 백그라운드 로딩 실패: {e}")
+        finally:
+            self._easyocr_ready.set()
+    
+    def _ensure_easyocr_reader(self) -> None:
+        """Create the EasyOCR reader once (thread-safe)."""
+        with self._easyocr_lock:
+            if self._easyocr_reader is None:
+                import easyocr
+                self._easyocr_reader = easyocr.Reader(['en'], gpu=False, verbose=False)
     
     def solve(self, image: Image.Image) -> str:
         """
@@ -67,27 +264,66 @@ class CaptchaSolver:
         Returns:
             4-digit string or empty string if failed
         """
-        result = ""
+        # PNG 인코딩은 한 번만 하고 캐시 키와 ddddocr 입력으로 공유
+        # (무압축: deflate 생략, ddddocr 쪽 디코딩도 가벼움)
+        img_byte_arr = io.BytesIO()
+        image.save(img_byte_arr, format='PNG', compress_level=0)
+        img_bytes = img_byte_arr.getvalue()
+        key = hashlib.blake2b(img_bytes, digest_size=8).digest()
+        self._last_key = key
         
-        # 1. Try ddddocr first (best for CAPTCHA)
-        result = self._try_ddddocr(image)
-        if result and len(result) == 4:
-            return result
+        cached = self._cache.get(key)
+        if cached:
+            self._cache.move_to_end(key)
+            self.logger.info(f"♻️ 캡차 캐시 적중: {cached}")
+            return cached
+        
+        result = self._solve_uncached(image, img_bytes)
+        if result:
+            self._cache[key] = result
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+    
+    def forget_last(self) -> None:
+        """Drop the cached answer for the last solved image (call when the server rejects it)."""
+        if self._last_key is not None:
+            self._cache.pop(self._last_key, None)
+            self._last_key = None
+    
+    def _solve_uncached(self, image: Image.Image, img_bytes: bytes) -> str:
+        """
+        Use ddddocr; only when it fails, run EasyOCR and pytesseract in parallel as fallbacks.
         
-        # 2. Fallback to EasyOCR
-        result = self._try_easyocr(image)
-        if result and len(result) == 4:
-            return result
+        - ddddocr가 4자리면 바로 채택 (pytesseract 프로세스를 띄우지 않음)
+        - 실패 시 pytesseract는 워커에서, EasyOCR은 현재 스레드에서 실행
+        - EasyOCR이 4자리면 채택, 아니면 pytesseract 결과를 TESSERACT_WAIT초까지만 대기
+        """
+        dddd = self._try_ddddocr(image, img_bytes)
+        if len(dddd) == 4:
+            return dddd
         
-        # 3. Final fallback to pytesseract
-        result = self._try_pytesseract(image)
-        if result and len(result) == 4:
-            return result
+        tess_future = self._vote_pool.submit(self._try_pytesseract, image)
+        easy = self._try_easyocr(image)
+        if len(easy) == 4:
+            tess_future.cancel()
+            return easy
+        try:
+            tess = tess_future.result(timeout=self.TESSERACT_WAIT)
+        except FuturesTimeoutError:
+            self.logger.info(f"⏱️ pytesseract {self.TESSERACT_WAIT}초 초과 - 결과 무시")
+            tess = ""
+        if len(tess) == 4:
+            return tess
         
         self.logger.info("❌ 모든 OCR 방법 실패")
         return ""
     
-    def _try_ddddocr(self, image: Image.Image) -> str:
+    def close(self) -> None:
+        """Stop the pytesseract worker (pending jobs are cancelled)."""
+        self._vote_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _try_ddddocr(self, image: Image.Image, img_bytes: Optional[bytes] = None) -> str:
         """Try ddddocr for CAPTCHA recognition."""
         try:
             # Use preloaded instance or create new one
@@ -96,18 +332,19 @@ class CaptchaSolver:
                 self.logger.info("🤖 ddddocr 초기화 중...")
                 self._ddddocr = ddddocr.DdddOcr(show_ad=False)
             
-            self.logger.info("🤖 ddddocr로 캡차 인식 중...")
+            self.logger.debug("🤖 ddddocr로 캡차 인식 중...")
             
-            # PIL Image to bytes
-            img_byte_arr = io.BytesIO()
-            image.save(img_byte_arr, format='PNG')
-            img_bytes = img_byte_arr.getvalue()
+            # PIL Image to bytes (solve()에서 이미 인코딩했으면 재사용)
+            if img_bytes is None:
+                img_byte_arr = io.BytesIO()
+                image.save(img_byte_arr, format='PNG', compress_level=0)
+                img_bytes = img_byte_arr.getvalue()
             
             result = self._ddddocr.classification(img_bytes)
-            self.logger.info(f"🤖 ddddocr 결과: {result}")
+            self.logger.debug("🤖 ddddocr 결과: %s", result)
             
             # Extract only digits
-            result = re.sub(r'[^0-9]', '', result)
+            result = _digits_only(result)
             self.logger.info(f"🤖 ddddocr 결과 (숫자만): {result}")
             
             # Handle 3-digit result
@@ -130,16 +367,19 @@ class CaptchaSolver:
         try:
             import numpy as np
             
-            # Use preloaded instance or create new one
+            # Use preloaded instance (wait for background load) or create new one
             if self._easyocr_reader is None:
-                import easyocr
-                self.logger.info("🔄 EasyOCR 초기화 중...")
-                self._easyocr_reader = easyocr.Reader(['en'], verbose=False)
+                if self._easyocr_loading:
+                    self.logger.info("🔄 EasyOCR 백그라운드 로딩 대기 중...")
+                    self._easyocr_ready.wait(timeout=20)
+                if self._easyocr_reader is None:
+                    self.logger.info("🔄 EasyOCR 초기화 중...")
+                    self._ensure_easyocr_reader()
             
             self.logger.info("🔄 EasyOCR fallback 시작...")
             
-            # PIL Image to numpy array
-            captcha_array = np.array(image)
+            # PIL Image to numpy array (그레이스케일이면 2차원 uint8 배열 그대로 사용)
+            captcha_array = np.asarray(image)
             
             results = self._easyocr_reader.readtext(
                 captcha_array,
@@ -149,7 +389,7 @@ class CaptchaSolver:
                 paragraph=False,
                 batch_size=1
             )
-            self.logger.info(f"🔤 EasyOCR 원본 결과: {results}")
+            self.logger.debug("🔤 EasyOCR 원본 결과: %s", results)
             
             if results:
                 # Select result with highest confidence
@@ -159,7 +399,7 @@ class CaptchaSolver:
                 self.logger.info(f"🔤 EasyOCR 최고 확신도 결과: {result} (확신도: {confidence:.2f})")
                 
                 # Extract only digits
-                result = re.sub(r'[^0-9]', '', result)
+                result = _digits_only(result)
                 self.logger.info(f"🔤 EasyOCR 결과 (숫자만): {result}")
                 
                 # Handle 3-digit result
@@ -184,30 +424,41 @@ class CaptchaSolver:
             
             self.logger.info("🔄 pytesseract fallback 시작...")
             
-            configs = [
-                r'--oem 3 --psm 8 -c tessedit_char_whitelist=0123456789',
-                r'--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789',
-                r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789',
-                r'--oem 3 --psm 8',
-                r'--oem 3 --psm 7'
-            ]
-            
-            for i, config in enumerate(configs):
-                try:
-                    result = pytesseract.image_to_string(image, config=config).strip()
-                    result = re.sub(r'[^0-9]', '', result)
-                    self.logger.info(f"🔤 pytesseract 설정 {i+1} 결과 (숫자만): {result}")
-                    
-                    if result and len(result) == 4:
-                        return result
-                except Exception:
-                    continue
-            
-            return ""
+            # 흑백 이진화 후 PNG를 파일로 한 번만 쓰고 모든 설정에서 경로를 공유
+            # (PIL 이미지를 넘기면 설정마다 임시 PNG를 다시 저장함)
+            img_bw = image.convert('L').point(_BW_THRESHOLD_TABLE, mode='1')
+            with tempfile.NamedTemporaryFile(suffix='.png') as tmp:
+                img_bw.save(tmp, format='PNG', compress_level=0)
+                tmp.flush()
+                return self._run_pytesseract_configs(pytesseract, tmp.name)
             
         except Exception as e:
             self.logger.info(f"❌ pytesseract 오류: {e}")
             return ""
+    
+    def _run_pytesseract_configs(self, pytesseract, image) -> str:
+        """Run pytesseract over the digit-oriented configs until one yields 4 digits."""
+        configs = [
+            r'--oem 3 --psm 8 -c tessedit_char_whitelist=0123456789',
+            r'--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789',
+            r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789',
+            r'--oem 3 --psm 8',
+            r'--oem 3 --psm 7'
+        ]
+        
+        for i, config in enumerate(configs):
+            try:
+                # 설정 하나가 solve 전체를 붙잡지 않도록 2초 제한
+                result = pytesseract.image_to_string(image, config=config, timeout=2).strip()
+                result = _digits_only(result)
+                self.logger.debug("🔤 pytesseract 설정 %d 결과 (숫자만): %s", i + 1, result)
+                
+                if result and len(result) == 4:
+                    return result
+            except Exception:
+                continue
+        
+        return ""
 
 
 class ReservationBot:
@@ -225,6 +476,9 @@ class ReservationBot:
         self.logger = logger
         self.notifier = notifier
         self.captcha_solver = CaptchaSolver(logger)
+        # OCR 엔진 사전 로딩 (로그인과 병렬로 진행, 첫 solve 전에 합류)
+        self._ocr_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr")
+        self._preload_future: Optional[Future] = None
         self.target_time = datetime.now(KST).replace(
             hour=config.reservation.reservation_open_hour,
             minute=config.reservation.reservation_open_minute,
@@ -302,14 +556,14 @@ class ReservationBot:
             self.logger.info("📝 로그인 정보 입력 중")
             # 로그인 폼 요소 대기
             login_id_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.NAME, 'login_id'))
+                EC.presence_of_element_located(_SEL_LOGIN_ID)
             )
             login_id_input.send_keys(self.config.login_id)
-            self.driver.find_element(By.NAME, 'login_pwd').send_keys(self.config.login_password)
+            self.driver.find_element(*_SEL_LOGIN_PWD).send_keys(self.config.login_password)
             
             self.logger.info("🔘 로그인 버튼 클릭")
             button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, '//*[@id="content"]/div/div/div/button'))
+                EC.element_to_be_clickable(_SEL_LOGIN_BUTTON)
             )
             # Scroll and click
             self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
@@ -356,7 +610,8 @@ class ReservationBot:
                 EC.element_to_be_clickable((By.LINK_TEXT, "일일입장 예약신청"))
             )
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", link)
-            time.sleep(3)  # Wait for JS binding
+            # 고정 3초 대신 문서 로딩과 진행 중인 jQuery AJAX가 끝날 때까지만 대기 (JS 바인딩 완료)
+            WebDriverWait(self.driver, 10, poll_frequency=0.1).until(lambda d: d.execute_script(_JS_PAGE_IDLE))
             self.driver.execute_script("arguments[0].click();", link)
             self.logger.info("✅ 예약 페이지 진입 완료")
             return True
@@ -377,47 +632,44 @@ class ReservationBot:
         
         self.logger.info(f"⏰ 로컬 시간 9시 대기 (목표: {target_time.strftime('%H:%M:%S.%f')[:-3]})")
         
-        current_time = datetime.now(KST)
-        time_diff = (target_time - current_time).total_seconds()
+        # 벽시계는 한 번만 읽고 이후 남은 시간은 perf_counter(monotonic) 데드라인 기준으로 계산
+        time_diff = target_time.timestamp() - time.time()
+        deadline_ns = time.perf_counter_ns() + int(time_diff * 1e9)
         
         if time_diff > 0:
             # Wait until 10 seconds before
             if time_diff > 10:
                 sleep_time = time_diff - 10
                 self.logger.info(f"목표 시각까지 {sleep_time:.1f}초 대기...")
-                time.sleep(sleep_time)
+                time.sleep((deadline_ns - time.perf_counter_ns()) / 1e9 - 10)
             
-            # Precise wait for last 10 seconds
+            # Precise wait for last 10 seconds: 2ms 전까지 한 번에 sleep 후 스핀
             self.logger.info("🎯 마지막 10초 정밀 대기 시작...")
-            loop_count = 0
-            while True:
-                current_time = datetime.now(KST)
-                if current_time >= target_time:
-                    break
-                loop_count += 1
-                if loop_count > 20000000:  # Prevent infinite loop
-                    self.logger.info("⚠️ 대기 시간이 너무 길어 강제 종료합니다.")
-                    break
-                time.sleep(0.0001)
+            remain = (deadline_ns - time.perf_counter_ns()) / 1e9
+            if remain > 0.002:
+                time.sleep(remain - 0.002)
+            while time.perf_counter_ns() < deadline_ns:
+                pass
+            current_time = datetime.fromtimestamp(time.time(), KST)
             
-            actual_time = datetime.now(KST)
-            self.logger.info(f"🚀 목표 시각 도달! 새로고침 시작!")
-            self.logger.info(f"   실제 로컬 시각: {actual_time.strftime('%H:%M:%S.%f')[:-3]}")
+            # 새로고침 직전이므로 로그는 한 줄만 출력
+            self.logger.info(f"🚀 목표 시각 도달! 새로고침 시작! (실제 로컬 시각: {current_time.strftime('%H:%M:%S.%f')[:-3]})")
         else:
             self.logger.info("이미 목표 시각이 지났습니다. 즉시 실행합니다.")
     
     def refresh_and_wait_for_dates(self) -> bool:
         """Refresh page and wait for available dates."""
         try:
-            self.logger.info("🔄 페이지 새로고침")
+            # page_load_strategy='none'이면 refresh()가 새 문서 로딩 전에 반환되므로
+            # 이전 문서의 <html>이 stale 될 때까지 기다린 뒤 날짜를 찾음 (이전 DOM의 날짜를 읽지 않도록)
+            old_root = self.driver.find_element(By.TAG_NAME, 'html')
             self.driver.refresh()
+            WebDriverWait(self.driver, 60, poll_frequency=0.05).until(EC.staleness_of(old_root))
             self.logger.info("✅ 페이지 새로고침 완료")
             
             self.logger.info("📅 예약 가능한 날짜 로딩 대기...")
             WebDriverWait(self.driver, 1000).until(
-                EC.presence_of_all_elements_located(
-                    (By.XPATH, "//tbody//a[starts-with(@href, 'javascript:fn_tennis_time_list')]")
-                )
+                EC.presence_of_all_elements_located(_SEL_DATES)
             )
             self.logger.info("✅ 예약 가능한 날짜 확인 완료")
             return True
@@ -430,10 +682,7 @@ class ReservationBot:
         """Select the latest available date."""
         try:
             self.logger.info("📅 예약 가능한 날짜 검색 중...")
-            clickable_dates = self.driver.find_elements(
-                By.XPATH,
-                "//tbody//a[starts-with(@href, 'javascript:fn_tennis_time_list')]"
-            )
+            clickable_dates = self.driver.find_elements(*_SEL_DATES)
             
             if not clickable_dates:
                 self.logger.info("❌ 클릭 가능한 날짜가 없음")
@@ -447,7 +696,7 @@ class ReservationBot:
             
             # href에서 날짜 추출: javascript:fn_tennis_time_list('2025', '01', '05')
             href = target.get_attribute('href')
-            date_match = re.search(r"fn_tennis_time_list\('(\d+)',\s*'(\d+)',\s*'(\d+)'\)", href)
+            date_match = _DATE_HREF_RE.search(href)
             if date_match:
                 year, month, day = date_match.groups()
                 date_text = f"{year}-{month}-{day}"
@@ -488,15 +737,10 @@ class ReservationBot:
             start_index = target_hour - base_hour
             
             self.logger.info(f"⏰ {target_hour}시-{target_hour + count}시 시간대 선택 중...")
-            self.logger.info(f"🔍 선택할 인덱스: {[start_index + i for i in range(count)]}")
+            self.logger.debug("🔍 선택할 인덱스: %d~%d", start_index, start_index + count - 1)
             
-            # 시간 슬롯 로딩 대기
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'ul#time_con li'))
-            )
-            time.sleep(0.5)  # 추가 대기
-            
-            time_slots = self.driver.find_elements(By.CSS_SELECTOR, 'ul#time_con li')
+            # 시간 슬롯 로딩 대기 후 상태를 한 번에 수집 (고정 sleep 대신 상태 라벨이 채워질 때까지)
+            time_slots = self._wait_time_slot_states()
             self.logger.info(f"📋 총 {len(time_slots)}개의 시간 슬롯 발견")
             
             click_count = 0
@@ -514,26 +758,19 @@ class ReservationBot:
                 
                 try:
                     slot = time_slots[slot_index]
-                    checkbox = slot.find_element(By.CSS_SELECTOR, 'input[type="checkbox"]')
-                    status_label = slot.find_element(By.CSS_SELECTOR, 'span.label')
                     
-                    if checkbox.is_enabled() and "신청가능" in status_label.text:
-                        self.driver.execute_script("arguments[0].click();", checkbox)
+                    if slot['enabled'] and "신청가능" in slot['status']:
+                        self._click_time_slots([slot_index])
                         click_count += 1
                         self.logger.info(f"✅ {slot_hour}시-{slot_hour + 1}시 선택 완료")
                         
                         # 첫 번째 슬롯에서 날짜 정보 추출 (label 텍스트: "1월 5일 (15:00 ~ 16:00)")
                         if i == 0:
-                            try:
-                                label_elem = slot.find_element(By.CSS_SELECTOR, 'label')
-                                label_text = label_elem.text
-                                # "1월 5일" 부분 추출
-                                date_match = re.search(r'(\d+월\s*\d+일)', label_text)
-                                if date_match:
-                                    self.selected_date_str = date_match.group(1)
-                                    self.logger.info(f"   └ 날짜 정보: {self.selected_date_str}")
-                            except Exception:
-                                pass
+                            # "1월 5일" 부분 추출
+                            date_match = _SLOT_DATE_RE.search(slot['label'])
+                            if date_match:
+                                self.selected_date_str = date_match.group(1)
+                                self.logger.info(f"   └ 날짜 정보: {self.selected_date_str}")
                         
                         # 각 시간 선택 후 가용 코트 확인
                         if preferred_courts:
@@ -592,29 +829,37 @@ class ReservationBot:
             except NoAlertPresentException:
                 pass
             
-            time_slots = self.driver.find_elements(By.CSS_SELECTOR, 'ul#time_con li')
-            cleared_count = 0
-            for slot in time_slots:
-                try:
-                    checkbox = slot.find_element(By.CSS_SELECTOR, 'input[type="checkbox"]')
-                    if checkbox.is_selected():
-                        self.driver.execute_script("arguments[0].click();", checkbox)
-                        cleared_count += 1
-                        # 체크 해제 시 alert 발생할 수 있음
-                        try:
-                            alert = self.driver.switch_to.alert
-                            self.logger.info(f"ℹ️ 체크 해제 Alert 처리: {alert.text}")
-                            alert.accept()
-                        except NoAlertPresentException:
-                            pass
-                except Exception:
-                    continue
+            # 체크된 슬롯 전체를 브라우저 안에서 한 번에 해제 (체크 해제 alert는 스크립트가 수집)
+            cleared_count = self._click_time_slots(None, alert_tag="체크 해제")
             
             if cleared_count > 0:
                 self.logger.info(f"✅ {cleared_count}개 시간 슬롯 선택 해제 완료")
         except Exception as e:
             self.logger.info(f"⚠️ 시간 선택 초기화 중 오류: {e}")
     
+    def _wait_time_slot_states(self, timeout: float = 10.0) -> List[dict]:
+        """
+        Wait until every time slot has its status label rendered, then return the slot states.
+        (슬롯이 DOM에 생긴 뒤 상태 라벨이 채워지기까지의 고정 0.5초 대기를 대체)
+        """
+        def _ready(driver):
+            states = driver.execute_script(_JS_TIME_SLOT_STATES)
+            return states if states and all(slot['status'] for slot in states) else False
+        
+        return WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(_ready)
+    
+    def _click_time_slots(self, indices: Optional[List[int]], alert_tag: str = "시간 선택") -> int:
+        """
+        Click time-slot checkboxes in one round-trip (None = uncheck all checked slots).
+        
+        Returns:
+            Number of checkboxes clicked
+        """
+        outcome = self.driver.execute_script(_JS_TOGGLE_TIME_INDICES, indices) or {}
+        for msg in outcome.get('alerts', ()):
+            self.logger.info(f"ℹ️ {alert_tag} Alert 처리: {msg}")
+        return outcome.get('clicked', 0)
+    
     def get_available_courts(self, preferred_courts: list) -> List[int]:
         """
         Get list of available courts.
@@ -627,33 +872,12 @@ class ReservationBot:
         Returns:
             List of available court numbers
         """
-        available = []
-        
-        # 빠른 확인을 위해 implicit wait 일시적으로 비활성화
-        original_wait = self.driver.timeouts.implicit_wait
-        self.driver.implicitly_wait(0)
-        
+        # 코트별 find_element/get_attribute 왕복 대신 브라우저 안에서 한 번에 판별
         try:
-            for court_num in preferred_courts:
-                try:
-                    court_id = f'tennis_court_img_a_1_{court_num}'
-                    # find_elements는 없으면 빈 리스트 반환 (대기 없음)
-                    courts = self.driver.find_elements(By.ID, court_id)
-                    if not courts:
-                        continue
-                    court = courts[0]
-                    img_elements = court.find_elements(By.TAG_NAME, 'img')
-                    if not img_elements:
-                        continue
-                    if 'btn_tennis_noreserve' not in img_elements[0].get_attribute('src'):
-                        available.append(court_num)
-                except Exception:
-                    continue
-        finally:
-            # implicit wait 복구
-            self.driver.implicitly_wait(original_wait)
-        
-        return available
+            return self.driver.execute_script(_JS_AVAILABLE_COURTS, list(preferred_courts)) or []
+        except Exception as e:
+            self.logger.info(f"⚠️ 가용 코트 확인 오류: {e}")
+            return []
     
     def select_court_from_common(self, common_courts: list) -> Optional[int]:
         """
@@ -672,38 +896,40 @@ class ReservationBot:
             
         self.logger.info(f"🎾 코트 선택 시도 (대상: {common_courts})")
         
-        for court_num in common_courts:
+        remaining = list(common_courts)
+        while remaining:
+            court_num = None
             try:
-                self.logger.info(f"🔍 코트 {court_num} 선택 시도...")
-                
-                court_id = f'tennis_court_img_a_1_{court_num}'
-                court = self.driver.find_element(By.ID, court_id)
-                self.driver.execute_script("arguments[0].click();", court)
+                # 가용 여부 확인 + 클릭을 브라우저 안에서 한 번에 (코트별 find_element 왕복 제거)
+                result = self.driver.execute_script(_JS_CLICK_FIRST_AVAILABLE_COURT, remaining) or {}
+                court_num = result.get('court')
+                if court_num is None:
+                    break
+                remaining = remaining[remaining.index(court_num) + 1:]
                 self.logger.info(f"✅ 코트 {court_num} 클릭됨")
                 
-                # Check for alert (court already reserved)
+                # 클릭 중 기록된 알림 + 클릭 후 비동기로 뜨는 네이티브 알림(최대 0.3초) 확인
+                # (court already reserved → 다음 코트)
+                alerts = list(result.get('alerts') or [])
                 try:
-                    time.sleep(0.3)
-                    alert = self.driver.switch_to.alert
-                    alert_text = alert.text
-                    self.logger.info(f"⚠️ 알림창 감지: {alert_text}")
-                    
-                    if "예약이 완료된 코트입니다" in alert_text:
-                        alert.accept()
-                        self.logger.info(f"❌ 코트 {court_num} 이미 예약 완료 - 다음 코트 시도")
-                        continue
-                    else:
-                        alert.accept()
-                        self.logger.info(f"✅ 알림창 처리 완료: {alert_text}")
-                        
-                except NoAlertPresentException:
+                    alert = WebDriverWait(self.driver, 0.3, poll_frequency=0.05).until(EC.alert_is_present())
+                    alerts.append(alert.text)
+                    alert.accept()
+                except TimeoutException:
                     pass
+                for alert_text in alerts:
+                    self.logger.info(f"⚠️ 알림창 감지: {alert_text}")
+                if any("예약이 완료된 코트입니다" in a for a in alerts):
+                    self.logger.info(f"❌ 코트 {court_num} 이미 예약 완료 - 다음 코트 시도")
+                    continue
                 
                 self.logger.info(f"✅ 코트 {court_num} 선택 완료!")
                 return court_num
                     
             except Exception as e:
-                self.logger.info(f"⚠️ 코트 {court_num} 확인 중 오류: {e}")
+                self.logger.info(f"⚠️ 코트 {court_num or remaining[0]} 확인 중 오류: {e}")
+                if court_num is None:
+                    remaining = remaining[1:]
                 continue
         
         self.logger.info("❌ 예약 가능한 코트가 없음")
@@ -721,28 +947,16 @@ class ReservationBot:
                 
                 # 캡차 이미지가 표시될 때까지 대기 (visibility, not just presence)
                 captcha_element = WebDriverWait(self.driver, 60).until(
-                    EC.visibility_of_element_located(
-                        (By.XPATH, '//*[@id="layer_captcha_wrap"]/div/img')
-                    )
+                    EC.visibility_of_element_located(_SEL_CAPTCHA_IMG)
                 )
                 
-                # 이미지가 완전히 로드될 때까지 추가 대기 (width > 0 확인)
-                for _ in range(10):
-                    try:
-                        size = captcha_element.size
-                        if size['width'] > 0 and size['height'] > 0:
-                            break
-                    except Exception:
-                        pass
-                    time.sleep(0.2)
-                
-                # 스크린샷 전 안전을 위한 짧은 대기
-                time.sleep(0.3)
-                
                 # Get CAPTCHA image as PIL Image
-                captcha_image = Image.open(io.BytesIO(captcha_element.screenshot_as_png))
+                captcha_image = self._capture_captcha_image(captcha_element)
                 
-                # Solve CAPTCHA
+                # Solve CAPTCHA (사전 로딩이 아직 진행 중이면 완료 대기)
+                if self._preload_future is not None:
+                    self._preload_future.result()
+                    self._preload_future = None
                 captcha_result = self.captcha_solver.solve(captcha_image)
                 
                 if not captcha_result:
@@ -768,6 +982,7 @@ class ReservationBot:
                 # Check if CAPTCHA was wrong
                 if "자동입력 방지 문자" in alert_text or "다시 입력" in alert_text:
                     self.logger.info(f"❌ 캡차 틀림 (시도 {attempt}/{max_retries})")
+                    self.captcha_solver.forget_last()
                     alert.accept()
                     
                     if attempt < max_retries:
@@ -788,6 +1003,23 @@ class ReservationBot:
         self.logger.info(f"❌ 캡차 {max_retries}회 시도 모두 실패")
         return False
     
+    def _capture_captcha_image(self, captcha_element) -> Image.Image:
+        """
+        Read the already-loaded captcha <img> pixels via canvas (no element screenshot).
+        캡차 URL을 다시 요청하면 새 캡차가 발급되므로 HTTP 재다운로드 대신 브라우저에 로드된 이미지를 사용합니다.
+        """
+        try:
+            # 이미지 디코딩 완료까지 대기 (complete && naturalWidth > 0)
+            WebDriverWait(self.driver, 2, poll_frequency=0.05).until(
+                lambda d: d.execute_script(_JS_IMG_LOADED, captcha_element)
+            )
+            data_url = self.driver.execute_script(_JS_IMG_TO_DATA_URL, captcha_element)
+            if data_url and data_url.startswith('data:image/png;base64,'):
+                return Image.open(io.BytesIO(base64.b64decode(data_url.split(',', 1)[1])))
+        except Exception as e:
+            self.logger.info(f"⚠️ 캡차 canvas 추출 실패, 스크린샷으로 대체: {e}")
+        return Image.open(io.BytesIO(captcha_element.screenshot_as_png))
+    
     def _refresh_captcha(self) -> None:
         """Refresh CAPTCHA image for retry."""
         try:
@@ -815,9 +1047,7 @@ class ReservationBot:
             
             # 새로고침 버튼을 못 찾으면 캡차 이미지 자체를 클릭 시도
             try:
-                captcha_img = self.driver.find_element(
-                    By.XPATH, '//*[@id="layer_captcha_wrap"]/div/img'
-                )
+                captcha_img = self.driver.find_element(*_SEL_CAPTCHA_IMG)
                 captcha_img.click()
                 self.logger.info("✅ 캡차 이미지 클릭으로 새로고침")
                 time.sleep(0.5)
@@ -860,7 +1090,9 @@ class ReservationBot:
             self.logger.info("🛒 장바구니 담기 확인 중...")
             time.sleep(2)
             
-            basket = self.driver.find_element(By.XPATH, '//*[@id="aplictn_info"]/ul')
+            basket = WebDriverWait(self.driver, self.config.implicit_wait).until(
+                EC.presence_of_element_located((By.XPATH, '//*[@id="aplictn_info"]/ul'))
+            )
             items = basket.find_elements(By.TAG_NAME, 'li')
             
             content = []
@@ -954,91 +1186,48 @@ class ReservationBot:
             else:
                 self.logger.info(f"⏰ 가능한 가장 늦은 연속 {count}시간 탐색 중...")
             
-            # 시간 슬롯 로딩 대기
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'ul#time_con li'))
-            )
-            time.sleep(0.5)
-            
-            time_slots = self.driver.find_elements(By.CSS_SELECTOR, 'ul#time_con li')
+            # 시간 슬롯 로딩 대기 후 상태를 한 번에 수집해 연속 가용 구간은 Python에서 판별
+            time_slots = self._wait_time_slot_states()
             total_slots = len(time_slots)
             self.logger.info(f"📋 총 {total_slots}개의 시간 슬롯 발견")
             
             base_hour = 6  # 06시 = index 0
             
-            # 뒤에서부터 탐색 (가장 늦은 시간부터)
-            for start_index in range(total_slots - count, -1, -1):
+            start_index = _find_latest_window(time_slots, count, exclude_hours, base_hour)
+            if start_index is not None:
                 start_hour = base_hour + start_index
+                # 예약 가능한 연속 시간대 발견! 선택 진행하면서 가용 코트 확인
+                self.logger.info(f"✅ {start_hour}시-{start_hour + count}시 예약 가능!")
                 
-                # 이미 시도한 시간대는 건너뛰기
-                if start_hour in exclude_hours:
-                    continue
-                    
-                self.logger.info(f"🔍 {start_hour}시-{start_hour + count}시 확인 중...")
+                # 첫 번째 슬롯에서 날짜 정보 추출
+                date_match = _SLOT_DATE_RE.search(time_slots[start_index]['label'])
+                if date_match:
+                    self.selected_date_str = date_match.group(1)
+                    self.logger.info(f"   └ 날짜 정보: {self.selected_date_str}")
                 
-                # 연속된 슬롯이 모두 예약 가능한지 확인
-                all_available = True
+                if not preferred_courts:
+                    # 코트 확인이 없으면 구간 전체를 한 번에 클릭
+                    self._click_time_slots(list(range(start_index, start_index + count)))
+                    self.logger.info(f"✅ {start_hour}시-{start_hour + count}시 선택 완료")
+                    return True, start_hour, []
+                
+                # 시간을 하나씩 선택하면서 시간별 가용 코트를 확인해 교집합 계산
+                # (클릭 중 뜬 alert는 스크립트가 수집해 로그로 남김)
+                available_per_hour = []
                 for i in range(count):
-                    slot_index = start_index + i
-                    slot = time_slots[slot_index]
-                    
-                    try:
-                        checkbox = slot.find_element(By.CSS_SELECTOR, 'input[type="checkbox"]')
-                        status_label = slot.find_element(By.CSS_SELECTOR, 'span.label')
-                        
-                        if not (checkbox.is_enabled() and "신청가능" in status_label.text):
-                            all_available = False
-                            break
-                    except Exception:
-                        all_available = False
-                        break
+                    slot_hour = start_hour + i
+                    self._click_time_slots([start_index + i])
+                    self.logger.info(f"✅ {slot_hour}시-{slot_hour + 1}시 선택 완료")
+                    time.sleep(0.3)  # 코트 상태 업데이트 대기
+                    available = self.get_available_courts(preferred_courts)
+                    self.logger.info(f"   └ {slot_hour}시 가용 코트: {available}")
+                    available_per_hour.append(available)
                 
-                if all_available:
-                    # 예약 가능한 연속 시간대 발견! 선택 진행하면서 가용 코트 확인
-                    self.logger.info(f"✅ {start_hour}시-{start_hour + count}시 예약 가능!")
-                    
-                    common_courts = set(preferred_courts) if preferred_courts else set()
-                    
-                    for i in range(count):
-                        slot_index = start_index + i
-                        slot_hour = start_hour + i
-                        slot = time_slots[slot_index]
-                        checkbox = slot.find_element(By.CSS_SELECTOR, 'input[type="checkbox"]')
-                        self.driver.execute_script("arguments[0].click();", checkbox)
-                        self.logger.info(f"✅ {slot_hour}시-{slot_hour + 1}시 선택 완료")
-                        # 클릭 후 alert 처리
-                        self._dismiss_alert_if_present()
-                        
-                        # 첫 번째 슬롯에서 날짜 정보 추출
-                        if i == 0:
-                            try:
-                                label_elem = slot.find_element(By.CSS_SELECTOR, 'label')
-                                label_text = label_elem.text
-                                date_match = re.search(r'(\d+월\s*\d+일)', label_text)
-                                if date_match:
-                                    self.selected_date_str = date_match.group(1)
-                                    self.logger.info(f"   └ 날짜 정보: {self.selected_date_str}")
-                            except Exception:
-                                pass
-                        
-                        # 각 시간 선택 후 가용 코트 확인
-                        if preferred_courts:
-                            time.sleep(0.3)  # 코트 상태 업데이트 대기
-                            available = self.get_available_courts(preferred_courts)
-                            self.logger.info(f"   └ {slot_hour}시 가용 코트: {available}")
-                            
-                            if i == 0:
-                                common_courts = set(available)
-                            else:
-                                common_courts = common_courts.intersection(set(available))
-                    
-                    # 교집합을 우선순위 순서로 정렬
-                    common_courts_ordered = [c for c in preferred_courts if c in common_courts] if preferred_courts else []
-                    
-                    if preferred_courts:
-                        self.logger.info(f"✅ 교집합 코트 (모든 시간 가능): {common_courts_ordered}")
-                    
-                    return True, start_hour, common_courts_ordered
+                # 교집합을 우선순위 순서로 정렬
+                common_courts_ordered = _common_courts(preferred_courts, available_per_hour)
+                self.logger.info(f"✅ 교집합 코트 (모든 시간 가능): {common_courts_ordered}")
+                
+                return True, start_hour, common_courts_ordered
             
             self.logger.info("❌ 예약 가능한 연속 시간대를 찾을 수 없음")
             return False, None, []
@@ -1161,15 +1350,15 @@ class ReservationBot:
             self.logger.info(f"✔️ {i}순위: {s.name} ({time_desc}, 코트: {len(s.preferred_courts)}개)")
         
         try:
-            # 1. Login
+            # 1. Preload OCR engines (로그인·페이지 진입의 네트워크 대기 중 백그라운드 로딩)
+            self._preload_future = self._ocr_pool.submit(self.captcha_solver.preload)
+            
+            # 2. Login
             if not self.login():
                 result.error_message = "로그인 실패"
                 self.notifier.send_failure("로그인 실패", result)
                 return 1
             
-            # 2. Preload OCR engines (로그인 직후 바로 시작 - 페이지 진입/대기 중 로딩)
-            self.captcha_solver.preload()
-            
             # 3. Navigate to reservation page
             if not self.navigate_to_reservation_page():
                 result.error_message = "예약 페이지 진입 실패"
@@ -1236,7 +1425,7 @@ class ReservationBot:
                 result.court_number = selected_court
                 result.time_slot = selected_time_slot
                 result.strategy_name = successful_strategy.name
-                result.court_type = "실내 코트" if selected_court in INDOOR_COURTS else "야외 코트"
+                result.court_type = "실내 코트" if selected_court in INDOOR_COURTS_SET else "야외 코트"
                 if self.selected_date_str:
                     result.date = self.selected_date_str
                 
@@ -0,0 +1,66 @@
+"""Tests for CAPTCHA OCR post-processing and engine fallback (engines are stubbed)."""
+import time
+
+from PIL import Image
+
+from src.notifier import Logger
+from src.reservation import CaptchaSolver, _digits_only
+
+
+def test_digits_only_strips_ascii_and_non_ascii():
+    assert _digits_only("12 34") == "1234"
+    assert _digits_only("a1b2-c3.d4\n") == "1234"
+    assert _digits_only("1二3四5") == "135"
+    assert _digits_only("") == ""
+
+
+def _solver(monkeypatch, dddd="", tess="", easy="", tess_delay=0.0):
+    solver = CaptchaSolver(Logger(debug=False))
+    calls = []
+
+    def fake_tess(image):
+        calls.append("tess")
+        time.sleep(tess_delay)
+        return tess
+
+    def fake_easy(image):
+        calls.append("easy")
+        return easy
+
+    monkeypatch.setattr(solver, "_try_ddddocr", lambda image, img_bytes=None: dddd)
+    monkeypatch.setattr(solver, "_try_pytesseract", fake_tess)
+    monkeypatch.setattr(solver, "_try_easyocr", fake_easy)
+    return solver, calls
+
+
+def _solve(solver) -> str:
+    return solver._solve_uncached(Image.new("L", (100, 40), 255), b"")
+
+
+def test_ddddocr_success_skips_fallback_engines(monkeypatch):
+    solver, calls = _solver(monkeypatch, dddd="1234", tess="5678", easy="9999")
+    assert _solve(solver) == "1234"
+    assert calls == []
+
+
+def test_ddddocr_failure_uses_easyocr_without_waiting_for_pytesseract(monkeypatch):
+    solver, _ = _solver(monkeypatch, dddd="12", tess="5678", easy="4321", tess_delay=1.0)
+    start = time.monotonic()
+    assert _solve(solver) == "4321"
+    assert time.monotonic() - start < 0.5
+
+
+def test_ddddocr_and_easyocr_failure_uses_pytesseract(monkeypatch):
+    solver, _ = _solver(monkeypatch, dddd="", tess="5678", easy="56")
+    assert _solve(solver) == "5678"
+    solver, _ = _solver(monkeypatch, dddd="", tess="", easy="")
+    assert _solve(solver) == ""
+
+
+def test_pytesseract_wait_is_bounded(monkeypatch):
+    monkeypatch.setattr(CaptchaSolver, "TESSERACT_WAIT", 0.2)
+    solver, _ = _solver(monkeypatch, dddd="", tess="5678", easy="", tess_delay=1.0)
+    start = time.monotonic()
+    assert _solve(solver) == ""
+    assert time.monotonic() - start < 0.6
+    solver.close()
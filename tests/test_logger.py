@@ -0,0 +1,72 @@
+"""Tests for the Logger line buffer."""
+import threading
+
+from src.notifier import Logger
+
+
+def _logger(monkeypatch, max_lines=None) -> Logger:
+    if max_lines is not None:
+        monkeypatch.setattr(Logger, "MAX_LINES", max_lines)
+    return Logger(debug=False)
+
+
+def test_buffer_keeps_lines_and_char_count(monkeypatch):
+    logger = _logger(monkeypatch)
+    logger.info("first")
+    logger.info("second")
+    buf = logger.get_buffer()
+    assert buf.count("\n") == 2
+    assert "first" in buf and buf.index("first") < buf.index("second")
+    assert logger.buffer_size == len(buf)
+
+
+def test_buffer_drops_oldest_lines_past_max(monkeypatch):
+    logger = _logger(monkeypatch, max_lines=3)
+    for i in range(5):
+        logger.info(f"line-{i}")
+    buf = logger.get_buffer()
+    assert "line-0" not in buf and "line-1" not in buf
+    assert "line-2" in buf and "line-4" in buf
+    assert logger.buffer_size == len(buf)
+
+
+def test_get_tail_matches_buffer_suffix(monkeypatch):
+    logger = _logger(monkeypatch)
+    for i in range(20):
+        logger.info(f"message {i}")
+    buf = logger.get_buffer()
+    for n in (1, 10, 57, len(buf) - 1):
+        assert logger.get_tail(n) == buf[-n:]
+    assert logger.get_tail(len(buf) + 100) == buf
+
+
+def test_debug_is_skipped_unless_enabled(monkeypatch):
+    logger = _logger(monkeypatch)
+    logger.debug("hidden %s", "x")
+    assert logger.buffer_size == 0
+    verbose = Logger(debug=True)
+    verbose.debug("shown %s", "x")
+    assert "shown x" in verbose.get_buffer()
+
+
+def test_clear_buffer_resets_size(monkeypatch):
+    logger = _logger(monkeypatch)
+    logger.info("something")
+    logger.clear_buffer()
+    assert logger.get_buffer() == "" and logger.buffer_size == 0
+
+
+def test_concurrent_logging_keeps_char_count_consistent(monkeypatch):
+    logger = _logger(monkeypatch, max_lines=50)
+
+    def worker(tag):
+        for i in range(500):
+            logger.info(f"{tag}-{i}")
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert logger.buffer_size == len(logger.get_buffer())
+    assert logger.get_buffer().count("\n") == 50
@@ -0,0 +1,13 @@
+"""Tests for SlackNotifier setup."""
+from types import SimpleNamespace
+
+from src.notifier import Logger, SlackNotifier
+
+
+def test_disabled_notifier_starts_no_worker():
+    config = SimpleNamespace(slack_url="", base_url="https://example.com", login_id="user")
+    notifier = SlackNotifier(config, Logger(debug=False))
+    assert not notifier.enabled
+    assert notifier._worker is None
+    assert notifier.send_failure("실패") is False
+    assert notifier.flush(timeout=0.1)
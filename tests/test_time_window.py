@@ -0,0 +1,58 @@
+"""Tests for the latest free time window search."""
+from src.reservation import _common_courts, _find_latest_window
+
+
+def _slots(pattern: str) -> list:
+    """'o' = 신청가능, 'x' = 마감, '-' = 비활성 (index 0 = 06시)."""
+    states = {
+        'o': {'enabled': True, 'status': '신청가능'},
+        'x': {'enabled': True, 'status': '마감'},
+        '-': {'enabled': False, 'status': '신청가능'},
+    }
+    return [dict(states[c], label='1월 5일') for c in pattern]
+
+
+def test_picks_latest_window():
+    # 07-09시와 19-22시 가능 → 가장 늦은 2시간은 20시 시작 (index 14)
+    slots = _slots('xoox' + 'x' * 9 + 'ooo')
+    assert _find_latest_window(slots, 2, set()) == 14
+
+
+def test_requires_consecutive_slots():
+    assert _find_latest_window(_slots('oxoxo'), 2, set()) is None
+    assert _find_latest_window(_slots('oxoxo'), 1, set()) == 4
+
+
+def test_disabled_slot_breaks_run():
+    assert _find_latest_window(_slots('oo-o'), 2, set()) == 0
+
+
+def test_exclude_hours_skips_start_hour():
+    slots = _slots('oooo')
+    assert _find_latest_window(slots, 2, set()) == 2
+    # 08시 시작은 이미 시도 → 07시 시작
+    assert _find_latest_window(slots, 2, {8}) == 1
+    assert _find_latest_window(slots, 2, {6, 7, 8}) is None
+
+
+def test_custom_base_hour_and_edge_cases():
+    slots = _slots('ooo')
+    assert _find_latest_window(slots, 2, {20}, base_hour=19) == 0
+    assert _find_latest_window(slots, 4, set()) is None
+    assert _find_latest_window([], 1, set()) is None
+
+
+def test_common_courts_keeps_preferred_order():
+    assert _common_courts([15, 14, 2, 13], [[2, 13, 14], [14, 13, 7]]) == [14, 13]
+    assert _common_courts([5, 6], [[5], [6]]) == []
+    assert _common_courts([5, 6], []) == [5, 6]
+
+
+def test_window_then_per_hour_court_intersection():
+    # 20-22시 구간 선택 → 20시, 21시 각각의 가용 코트 교집합만 허용
+    slots = _slots('x' * 14 + 'oo')
+    start = _find_latest_window(slots, 2, set())
+    assert 6 + start == 20
+    availability = {20: [15, 14, 2], 21: [14, 2, 9]}
+    hours = range(6 + start, 6 + start + 2)
+    assert _common_courts([15, 14, 19, 2], [availability[h] for h in hours]) == [14, 2]